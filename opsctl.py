@@ -14,6 +14,7 @@ Unified CLI for OCI infrastructure operations including:
 Usage:
     ./opsctl.py <module> <command> [args...]
     ./opsctl.py --env prod bastion list-sessions
+    ./opsctl.py batch commands.json
 
 Modules:
     bastion      - OCI Bastion session management
@@ -26,13 +27,23 @@ Modules:
     backend      - Backend service connections
 """
 
-import argparse
-import json
+from __future__ import annotations
+
+# argparse, json and subprocess are imported where they are used so that
+# the common dispatch path pays as little interpreter start-up as possible.
 import os
-import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Find the config file and scripts directory
@@ -53,83 +64,232 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    import json
+    return json.dumps(obj, indent=2)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+def _log_prefix(color: str, label: str, stream: Any) -> str:
+    """Build a log prefix once, without color for NO_COLOR or non-TTY output."""
+    if os.environ.get("NO_COLOR") is None and stream.isatty():
+        return f"{color}[{label}]{Colors.NC}"
+    return f"[{label}]"
+
+
+_INFO_PREFIX = _log_prefix(Colors.BLUE, "INFO", sys.stdout)
+_SUCCESS_PREFIX = _log_prefix(Colors.GREEN, "SUCCESS", sys.stdout)
+_WARN_PREFIX = _log_prefix(Colors.YELLOW, "WARN", sys.stdout)
+_ERROR_PREFIX = _log_prefix(Colors.RED, "ERROR", sys.stderr)
+
+
 def log_info(message: str) -> None:
-    print(f"{Colors.BLUE}[INFO]{Colors.NC} {message}")
+    print(_INFO_PREFIX, message)
 
 
 def log_success(message: str) -> None:
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.NC} {message}")
+    print(_SUCCESS_PREFIX, message)
 
 
 def log_warn(message: str) -> None:
-    print(f"{Colors.YELLOW}[WARN]{Colors.NC} {message}")
+    print(_WARN_PREFIX, message)
 
 
 def log_error(message: str) -> None:
-    print(f"{Colors.RED}[ERROR]{Colors.NC} {message}", file=sys.stderr)
+    print(_ERROR_PREFIX, message, file=sys.stderr)
+
+
+# Parsed config cache: path -> (st_mtime_ns, st_size, config)
+_CONFIG_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
 
 
 def load_config() -> dict[str, Any]:
-    """Load configuration from config.json."""
-    if not CONFIG_FILE.exists():
+    """Load configuration from config.json.
+
+    The parsed result is cached on the file's mtime and size, so repeated
+    loads within one process skip JSON parsing until the file changes.
+    Callers that mutate the result must copy it first.
+    """
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
         log_warn(f"Config file not found: {CONFIG_FILE}")
         return {}
 
+    cached = _CONFIG_CACHE.get(CONFIG_FILE)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
     try:
-        with open(CONFIG_FILE) as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        with open(CONFIG_FILE, 'rb') as f:
+            config = _loads(f.read())
+    except ValueError as e:  # json/orjson JSONDecodeError
         log_error(f"Failed to parse config file: {e}")
         return {}
 
+    _CONFIG_CACHE[CONFIG_FILE] = (st.st_mtime_ns, st.st_size, config)
+    return config
+
 
 def save_config(config: dict[str, Any]) -> None:
     """Save configuration to config.json."""
     with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+        f.write(_dumps(config))
+    st = os.stat(CONFIG_FILE)
+    _CONFIG_CACHE[CONFIG_FILE] = (st.st_mtime_ns, st.st_size, config)
     log_success(f"Config saved to: {CONFIG_FILE}")
 
 
+def deep_merge(dst: dict, src: dict) -> dict:
+    """Recursively merge src into dst in place, skipping empty values."""
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            deep_merge(dst[key], value)
+        elif value:
+            dst[key] = value
+    return dst
+
+
 def apply_environment(config: dict, env_name: str) -> dict:
-    """Apply environment-specific configuration overrides."""
+    """Apply environment-specific configuration overrides.
+
+    Top-level scalar keys in an environment block override the "oci"
+    section; nested blocks (e.g. {"ssh": {...}}) are merged into the
+    section of the same name. Returns a new dict; the (possibly cached)
+    input config is not modified.
+    """
     environments = config.get("environments", {})
     if env_name in environments:
-        env_config = environments[env_name]
-        # Merge environment config into OCI config
-        for key, value in env_config.items():
-            if value:  # Only override if value is set
-                config.setdefault("oci", {})[key] = value
+        import copy
+        config = copy.deepcopy(config)
+        # Take the overlay from the copy: deep_merge stores nested dicts by
+        # reference, so the cached original must not be merged from
+        env_config = config["environments"][env_name]
+        oci_overrides = {
+            k: v for k, v in env_config.items() if not isinstance(v, dict)
+        }
+        deep_merge(config, {"oci": oci_overrides})
+        deep_merge(config, {
+            k: v for k, v in env_config.items() if isinstance(v, dict)
+        })
         log_info(f"Using environment: {env_name}")
     else:
         log_warn(f"Environment '{env_name}' not found in config")
     return config
 
 
+class OciSettings(NamedTuple):
+    profile: Optional[str] = None
+    compartment_ocid: Optional[str] = None
+    bastion_ocid: Optional[str] = None
+    vault_ocid: Optional[str] = None
+    key_ocid: Optional[str] = None
+    namespace: Optional[str] = None
+
+
+class SshSettings(NamedTuple):
+    key_path: Optional[str] = None
+    default_user: Optional[str] = None
+
+
+class TerraformSettings(NamedTuple):
+    state_bucket: Optional[str] = None
+    lock_bucket: Optional[str] = None
+
+
+class SessionSettings(NamedTuple):
+    default_ttl: int = 10800
+    tunnel_dir: Optional[str] = None
+
+
+class Settings(NamedTuple):
+    """Validated, typed view of the config sections modules depend on."""
+    oci: OciSettings
+    ssh: SshSettings
+    terraform: TerraformSettings
+    sessions: SessionSettings
+
+
+# Config section name -> settings class
+SETTINGS_SECTIONS = {
+    "oci": OciSettings,
+    "ssh": SshSettings,
+    "terraform": TerraformSettings,
+    "sessions": SessionSettings,
+}
+
+
+def parse_settings(config: dict) -> Settings:
+    """Validate the known config sections once and pack them into Settings.
+
+    Malformed sections or values are reported and treated as unset.
+    """
+    sections = {}
+    for name, cls in SETTINGS_SECTIONS.items():
+        data = config.get(name) or {}
+        if not isinstance(data, dict):
+            log_warn(f"Ignoring config section '{name}': expected an object")
+            data = {}
+
+        values = {}
+        for field in cls._fields:
+            value = data.get(field)
+            if value is None or value == "":
+                continue
+            if field == "default_ttl":
+                # "config set" stores strings, so accept "300" as well as 300
+                try:
+                    if isinstance(value, bool):
+                        raise TypeError
+                    value = int(value)
+                except (TypeError, ValueError):
+                    log_warn(f"Ignoring {name}.{field}: expected int")
+                    continue
+            elif not isinstance(value, str):
+                log_warn(f"Ignoring {name}.{field}: expected str")
+                continue
+            values[field] = value
+        sections[name] = cls(**values)
+
+    return Settings(**sections)
+
+
+# Environment variables exported to modules: (name, settings section, field)
+ENV_VAR_MAP = (
+    ("OCI_PROFILE", "oci", "profile"),
+    ("COMPARTMENT_OCID", "oci", "compartment_ocid"),
+    ("BASTION_OCID", "oci", "bastion_ocid"),
+    ("VAULT_OCID", "oci", "vault_ocid"),
+    ("KEY_OCID", "oci", "key_ocid"),
+    ("NAMESPACE", "oci", "namespace"),
+    ("SSH_KEY", "ssh", "key_path"),
+    ("DEFAULT_USER", "ssh", "default_user"),
+    ("STATE_BUCKET", "terraform", "state_bucket"),
+    ("LOCK_BUCKET", "terraform", "lock_bucket"),
+    ("DEFAULT_TTL", "sessions", "default_ttl"),
+    ("TUNNEL_DIR", "sessions", "tunnel_dir"),
+)
+
+
 def set_environment_vars(config: dict) -> None:
     """Set environment variables from config."""
-    oci_config = config.get("oci", {})
-    ssh_config = config.get("ssh", {})
-    tf_config = config.get("terraform", {})
-    session_config = config.get("sessions", {})
-
-    env_mapping = {
-        "OCI_PROFILE": oci_config.get("profile"),
-        "COMPARTMENT_OCID": oci_config.get("compartment_ocid"),
-        "BASTION_OCID": oci_config.get("bastion_ocid"),
-        "VAULT_OCID": oci_config.get("vault_ocid"),
-        "KEY_OCID": oci_config.get("key_ocid"),
-        "NAMESPACE": oci_config.get("namespace"),
-        "SSH_KEY": ssh_config.get("key_path"),
-        "DEFAULT_USER": ssh_config.get("default_user"),
-        "STATE_BUCKET": tf_config.get("state_bucket"),
-        "LOCK_BUCKET": tf_config.get("lock_bucket"),
-        "DEFAULT_TTL": str(session_config.get("default_ttl", 10800)),
-        "TUNNEL_DIR": session_config.get("tunnel_dir"),
-    }
-
-    for key, value in env_mapping.items():
-        if value:
-            os.environ[key] = value
+    settings = parse_settings(config)
+    env_vars = {}
+    for name, section, field in ENV_VAR_MAP:
+        value = getattr(getattr(settings, section), field)
+        if value is not None:
+            env_vars[name] = str(value)
+    os.environ.update(env_vars)
 
 
 # Module mappings
@@ -176,32 +336,64 @@ MODULES = {
     }
 }
 
+# Script paths per module, built once: name -> (python script, bash script)
+MODULE_SCRIPTS = {
+    name: (PYTHON_SCRIPTS_DIR / info["python"], BASH_SCRIPTS_DIR / info["bash"])
+    for name, info in MODULES.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _script_exists(path: Path) -> bool:
+    """Check that a module script exists, once per path per process."""
+    return path.exists()
+
 
 def run_module(
     module: str,
     command: str,
     args: list[str],
-    use_bash: bool = False
+    use_bash: bool = False,
+    replace_process: bool = False
 ) -> int:
-    """Run a module command."""
-    if module not in MODULES:
+    """Run a module command.
+
+    The module reads its settings from the environment variables exported
+    by set_environment_vars().
+
+    With replace_process, the module is exec'd in place of this process
+    (POSIX only) instead of being run as a child; use it only when there is
+    nothing left to do afterwards but return the module's exit code.
+    """
+    scripts = MODULE_SCRIPTS.get(module)
+    if scripts is None:
         log_error(f"Unknown module: {module}")
-        log_info(f"Available modules: {', '.join(MODULES.keys())}")
+        log_info(f"Available modules: {', '.join(MODULES)}")
         return 1
 
-    module_info = MODULES[module]
-
     if use_bash:
-        script_path = BASH_SCRIPTS_DIR / module_info["bash"]
+        script_path = scripts[1]
         cmd = [str(script_path), command] + args
     else:
-        script_path = PYTHON_SCRIPTS_DIR / module_info["python"]
+        script_path = scripts[0]
         cmd = [sys.executable, str(script_path), command] + args
 
-    if not script_path.exists():
+    if not _script_exists(script_path):
         log_error(f"Script not found: {script_path}")
         return 1
 
+    if replace_process and os.name != "nt":
+        # Anything still buffered would be lost when the image is replaced
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvp(cmd[0], cmd)
+        except OSError as e:
+            log_error(f"Failed to run command: {e}")
+            return 1
+
+    import subprocess
+
     try:
         result = subprocess.run(cmd)
         return result.returncode
@@ -210,28 +402,46 @@ def run_module(
         return 1
 
 
+@lru_cache(maxsize=256)
+def _key_parts(key: str) -> tuple[str, ...]:
+    """Split a dotted config key (e.g. "oci.profile") into its parts."""
+    return tuple(key.split("."))
+
+
+def get_config_value(config: dict, key: str) -> Any:
+    """Look up a dotted key path in config, returning None if absent."""
+    current: Any = config
+    for part in _key_parts(key):
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return current
+
+
+def set_config_value(config: dict, key: str, value: Any) -> None:
+    """Set a dotted key path in config, creating intermediate sections."""
+    *parents, leaf = _key_parts(key)
+    current = config
+    for part in parents:
+        current = current.setdefault(part, {})
+    current[leaf] = value
+
+
 def cmd_config(args: argparse.Namespace) -> int:
     """Handle config subcommand."""
     config = load_config()
 
     if args.config_command == "show":
-        print(json.dumps(config, indent=2))
+        print(_dumps(config))
     elif args.config_command == "set":
-        # Parse key path (e.g., "oci.profile" or "ssh.key_path")
-        keys = args.key.split(".")
-        current = config
-        for key in keys[:-1]:
-            current = current.setdefault(key, {})
-        current[keys[-1]] = args.value
+        # Key path, e.g. "oci.profile" or "ssh.key_path"
+        set_config_value(config, args.key, args.value)
         save_config(config)
     elif args.config_command == "get":
-        keys = args.key.split(".")
-        current = config
-        for key in keys:
-            current = current.get(key, {})
+        current = get_config_value(config, args.key)
         if current:
             if isinstance(current, dict):
-                print(json.dumps(current, indent=2))
+                print(_dumps(current))
             else:
                 print(current)
         else:
@@ -242,7 +452,7 @@ def cmd_config(args: argparse.Namespace) -> int:
             # Show specific environment
             envs = config.get("environments", {})
             if args.env_name in envs:
-                print(json.dumps(envs[args.env_name], indent=2))
+                print(_dumps(envs[args.env_name]))
             else:
                 log_error(f"Environment not found: {args.env_name}")
                 return 1
@@ -255,12 +465,85 @@ def cmd_config(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_batch_group(items: list[dict], use_bash: bool) -> list[int]:
+    """Run independent batch items concurrently and return their exit codes."""
+    def run_item(item: dict) -> int:
+        return run_module(
+            item["module"],
+            item.get("command", "--help"),
+            [str(a) for a in item.get("args", [])],
+            use_bash=use_bash
+        )
+
+    if len(items) == 1:
+        return [run_item(items[0])]
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(len(items), os.cpu_count() or 1)) as ex:
+        return list(ex.map(run_item, items))
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    """Run several module commands from a JSON list in one invocation.
+
+    Each item is {"module", "command", "args", "ignore_errors", "sequential"}.
+    Items run concurrently, except that a "sequential" item waits for all
+    earlier items and finishes before any later item starts. A failing item
+    without "ignore_errors" stops the rest of the batch. A JSON list of
+    exit codes is printed when done.
+    """
+    try:
+        if args.file == "-":
+            raw = sys.stdin.buffer.read()
+        else:
+            with open(args.file, "rb") as f:
+                raw = f.read()
+        batch = _loads(raw)
+    except (OSError, ValueError) as e:
+        log_error(f"Failed to read batch: {e}")
+        return 1
+
+    if not isinstance(batch, list) or not all(
+        isinstance(item, dict) and "module" in item for item in batch
+    ):
+        log_error('Batch must be a JSON list of {"module": ..., "command": ...} objects')
+        return 1
+
+    # Split into groups that may run concurrently; sequential items stand alone
+    groups: list[list[dict]] = []
+    for item in batch:
+        if item.get("sequential") or not groups or groups[-1][-1].get("sequential"):
+            groups.append([item])
+        else:
+            groups[-1].append(item)
+
+    results = []
+    status = 0
+    for group in groups:
+        codes = _run_batch_group(group, args.bash)
+        for item, code in zip(group, codes):
+            results.append({
+                "module": item["module"],
+                "command": item.get("command", "--help"),
+                "returncode": code
+            })
+            if code != 0 and not item.get("ignore_errors"):
+                status = 1
+        if status:
+            break
+
+    print(_dumps(results))
+    return status
+
+
 def cmd_list_modules(args: argparse.Namespace) -> int:
     """List available modules."""
-    print(f"\n{Colors.BOLD}Available Modules:{Colors.NC}\n")
-    for name, info in MODULES.items():
-        print(f"  {Colors.CYAN}{name:12}{Colors.NC}  {info['description']}")
-    print()
+    lines = [f"\n{Colors.BOLD}Available Modules:{Colors.NC}\n"]
+    lines.extend(
+        f"  {Colors.CYAN}{name:12}{Colors.NC}  {info['description']}"
+        for name, info in MODULES.items()
+    )
+    sys.stdout.write("\n".join(lines) + "\n\n")
     return 0
 
 
@@ -272,11 +555,51 @@ def cmd_help_module(args: argparse.Namespace) -> int:
         return 1
 
     # Run the module's help
-    return run_module(module, "--help", [], use_bash=args.bash)
+    return run_module(
+        module, "--help", [], use_bash=args.bash, replace_process=True
+    )
+
+
+def prepare_config(env_name: Optional[str]) -> None:
+    """Load config, apply an environment and export module env vars."""
+    config = load_config()
+
+    if env_name:
+        config = apply_environment(config, env_name)
+
+    set_environment_vars(config)
+
+
+def dispatch_module(module: str, remaining: list[str], use_bash: bool) -> int:
+    """Hand "<command> [args...]" off to a module, replacing this process."""
+    if remaining:
+        command = remaining[0]
+        module_args = remaining[1:]
+    else:
+        command = "--help"
+        module_args = []
+    return run_module(
+        module, command, module_args,
+        use_bash=use_bash, replace_process=True
+    )
 
 
 def main() -> int:
     """Main entry point."""
+    global CONFIG_FILE
+
+    # Fast path for the common "<module> <command> [args...]" form: with no
+    # global options before the module there is nothing for argparse to do.
+    argv = sys.argv[1:]
+    if argv and argv[0] in MODULES:
+        prepare_config(os.environ.get("OPSCTL_ENV"))
+        return dispatch_module(
+            argv[0], argv[1:],
+            os.environ.get("OPSCTL_USE_BASH") == "1"
+        )
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="OCI Operations Controller - Unified CLI for OCI infrastructure",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -287,6 +610,7 @@ Examples:
   %(prog)s backend connect-postgres 10.0.1.5 5432 mydb admin
   %(prog)s config set oci.compartment_ocid ocid1.compartment...
   %(prog)s modules
+  %(prog)s batch commands.json
 
 Environment Variables:
   OPSCTL_ENV         Default environment to use
@@ -333,20 +657,27 @@ Environment Variables:
     help_parser = subparsers.add_parser("help", help="Show help for a module")
     help_parser.add_argument("module", help="Module name")
 
+    # Run several module commands in one invocation
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run module commands listed in a JSON file"
+    )
+    batch_parser.add_argument(
+        "file", nargs="?", default="-",
+        help="JSON list of {module, command, args} objects (default: stdin)"
+    )
+
+    # Module commands; their arguments are left for the module to parse
+    for name, info in MODULES.items():
+        subparsers.add_parser(name, help=info["description"], add_help=False)
+
     # Parse known args first to handle module commands
     args, remaining = parser.parse_known_args()
 
     # Load and apply config
-    global CONFIG_FILE
     if args.config_file:
         CONFIG_FILE = Path(args.config_file)
 
-    config = load_config()
-
-    if args.env:
-        config = apply_environment(config, args.env)
-
-    set_environment_vars(config)
+    prepare_config(args.env)
 
     # Handle subcommands
     if args.subcommand == "config":
@@ -355,15 +686,10 @@ Environment Variables:
         return cmd_list_modules(args)
     elif args.subcommand == "help":
         return cmd_help_module(args)
+    elif args.subcommand == "batch":
+        return cmd_batch(args)
     elif args.subcommand in MODULES:
-        # Module command
-        if remaining:
-            command = remaining[0]
-            module_args = remaining[1:]
-        else:
-            command = "--help"
-            module_args = []
-        return run_module(args.subcommand, command, module_args, use_bash=args.bash)
+        return dispatch_module(args.subcommand, remaining, args.bash)
     elif args.subcommand:
         log_error(f"Unknown subcommand: {args.subcommand}")
         parser.print_help()
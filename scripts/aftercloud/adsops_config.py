@@ -23,28 +23,43 @@ CLI Usage:
 import argparse
 import json
 import os
+import re
 import sys
-from datetime import datetime
+import tempfile
+import time
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Centralized config location - NOT in repo
 CONFIG_DIR = Path.home() / ".adsops_config"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 def speak(message: str):
     """Print message with timestamp."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {message}")
+    print(f"[{time.strftime('%H:%M:%S')}] {message}")
     sys.stdout.flush()
 
 
 def speak_plain(message: str):
     """Print without timestamp."""
     print(message)
-    sys.stdout.flush()
 
 
 class Config:
@@ -88,30 +103,64 @@ class Config:
         "api_token", "api_key", "password", "secret",
         "private_key", "auth_token", "credential"
     ]
+    _SENSITIVE_RE = re.compile(
+        "|".join(map(re.escape, SENSITIVE_FIELDS)), re.IGNORECASE
+    )
+
+    # One shared instance per config file path
+    _INSTANCES: dict = {}
+
+    def __new__(cls, config_path: Optional[Path] = None):
+        key = (config_path or CONFIG_FILE).absolute()
+        instance = cls._INSTANCES.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._INSTANCES[key] = instance
+        return instance
 
     def __init__(self, config_path: Optional[Path] = None):
-        """Initialize config manager."""
+        """Initialize config manager (no-op if this path is already set up)."""
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
         self.config_path = config_path or CONFIG_FILE
         self.config_dir = self.config_path.parent
         self._config = None
+        self._config_stat = None
+        self._dir_ok = False
 
     def _ensure_dir(self):
         """Ensure config directory exists with secure permissions."""
+        if self._dir_ok:
+            return
+
         if not self.config_dir.exists():
             self.config_dir.mkdir(parents=True, mode=0o700)
         else:
             # Ensure restrictive permissions
             self.config_dir.chmod(0o700)
 
+        self._dir_ok = True
+
+    def _stat_key(self) -> Optional[tuple]:
+        """Return (mtime_ns, size) of the config file, or None if missing."""
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _load(self) -> dict:
-        """Load configuration from file."""
-        if self._config is not None:
+        """Load configuration from file (re-parsed only if the file changed)."""
+        stat_key = self._stat_key()
+        if self._config is not None and stat_key == self._config_stat:
             return self._config
 
-        if self.config_path.exists():
+        self._config_stat = stat_key
+        if stat_key is not None:
             try:
-                with open(self.config_path) as f:
-                    self._config = json.load(f)
+                with open(self.config_path, "rb") as f:
+                    self._config = _loads(f.read())
             except (json.JSONDecodeError, IOError) as e:
                 speak(f"Warning: Could not load config: {e}")
                 self._config = self.DEFAULT_CONFIG.copy()
@@ -121,14 +170,30 @@ class Config:
         return self._config
 
     def _save(self):
-        """Save configuration to file with secure permissions."""
+        """
+        Save configuration to file with secure permissions.
+
+        Writes a fresh 0600 temp file and renames it over the config, so
+        readers never see a partially written file.
+        """
         self._ensure_dir()
 
-        with open(self.config_path, "w") as f:
-            json.dump(self._config, f, indent=2)
+        # mkstemp creates a uniquely named 0600 file with O_EXCL
+        fd, tmp_name = tempfile.mkstemp(dir=self.config_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(_dumps(self._config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self.config_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
 
-        # Secure the config file
-        self.config_path.chmod(0o600)
+        self._config_stat = self._stat_key()
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -204,7 +269,7 @@ class Config:
             return "(not set)"
 
         # Check if this is a sensitive field
-        is_sensitive = any(s in key.lower() for s in self.SENSITIVE_FIELDS)
+        is_sensitive = self._SENSITIVE_RE.search(key) is not None
 
         if is_sensitive and isinstance(value, str) and len(value) > 8:
             return f"{value[:4]}...{value[-4:]}"
@@ -214,21 +279,31 @@ class Config:
         return str(value)
 
     def show(self, show_secrets: bool = False) -> dict:
-        """Get config for display (with masked secrets)."""
+        """
+        Get config for display (with masked secrets).
+
+        Only dicts containing a masked or unset value are copied; other
+        subtrees are shared with the loaded config and must not be modified.
+        """
         config = self._load()
 
         if show_secrets:
             return config
 
-        def mask_dict(d: dict, parent_key: str = "") -> dict:
-            result = {}
+        def mask_dict(d: dict) -> dict:
+            result = None
             for k, v in d.items():
-                full_key = f"{parent_key}.{k}" if parent_key else k
                 if isinstance(v, dict):
-                    result[k] = mask_dict(v, full_key)
+                    masked = mask_dict(v)
+                elif v is None or v == "" or self._SENSITIVE_RE.search(k):
+                    masked = self.mask_value(k, v)
                 else:
-                    result[k] = self.mask_value(k, v)
-            return result
+                    continue
+                if masked is not v:
+                    if result is None:
+                        result = dict(d)
+                    result[k] = masked
+            return d if result is None else result
 
         return mask_dict(config)
 
@@ -258,7 +333,7 @@ def set_value(section: str, key: str, value: Any):
 # CLI functionality
 def cmd_init(args):
     """Initialize config file."""
-    config = Config()
+    config = get_config()
 
     if config.exists() and not args.force:
         speak_plain(f"Config already exists at: {config.config_path}")
@@ -279,38 +354,38 @@ def cmd_init(args):
 
 def cmd_show(args):
     """Show current config."""
-    config = Config()
+    config = get_config()
 
     if not config.exists():
         speak_plain("No config file found.")
         speak_plain(f"Run 'adsops_config.py init' to create one at {CONFIG_FILE}")
         return
 
-    speak_plain("")
-    speak_plain(f"Config file: {config.config_path}")
-    speak_plain("=" * 60)
-    speak_plain("")
+    lines = ["", f"Config file: {config.config_path}", "=" * 60, ""]
 
     data = config.show(show_secrets=args.show_secrets)
 
     for section, values in data.items():
         if section.startswith("_"):
             continue
-        speak_plain(f"[{section}]")
+        lines.append(f"[{section}]")
         if isinstance(values, dict):
-            for k, v in values.items():
-                speak_plain(f"  {k}: {v}")
+            lines.extend(f"  {k}: {v}" for k, v in values.items())
         else:
-            speak_plain(f"  {values}")
-        speak_plain("")
+            lines.append(f"  {values}")
+        lines.append("")
 
     if not args.show_secrets:
-        speak_plain("(Secrets masked. Use --show-secrets to reveal)")
+        lines.append("(Secrets masked. Use --show-secrets to reveal)")
+
+    # One write for the whole listing
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def cmd_get(args):
     """Get a config value."""
-    config = Config()
+    config = get_config()
 
     parts = args.key.split(".", 1)
     if len(parts) != 2:
@@ -330,7 +405,7 @@ def cmd_get(args):
 
 def cmd_set(args):
     """Set a config value."""
-    config = Config()
+    config = get_config()
 
     parts = args.key.split(".", 1)
     if len(parts) != 2:
@@ -344,7 +419,7 @@ def cmd_set(args):
 
 def cmd_delete(args):
     """Delete a config key."""
-    config = Config()
+    config = get_config()
 
     parts = args.key.split(".", 1)
     section = parts[0]
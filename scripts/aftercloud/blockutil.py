@@ -8,6 +8,7 @@ Designed for accessibility with screen reader friendly output.
 Usage:
     blockutil.py list                      # List all block volumes
     blockutil.py list-boot                 # List boot volumes
+    blockutil.py list-all                  # List volumes, boot volumes, backups
     blockutil.py show <volume-id>          # Show volume details
     blockutil.py create --config vol.json  # Create block volume
     blockutil.py attach <vol-id> <inst-id> # Attach to instance
@@ -15,113 +16,419 @@ Usage:
     blockutil.py resize <volume-id> <size> # Resize volume
     blockutil.py delete <volume-id>        # Delete volume
     blockutil.py backup <volume-id>        # Create backup
+    blockutil.py backup-many <file>        # Back up volumes listed in file
+    blockutil.py delete-many <file>        # Delete volumes listed in file
     blockutil.py backups                   # List backups
 """
 
 import argparse
 import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 try:
-    import oci
+    import orjson
 except ImportError:
-    print("Error: OCI Python SDK not installed.")
-    print("Install with: pip install oci")
-    sys.exit(1)
+    orjson = None
+
+# The OCI SDK is slow to import; load_oci() brings it in on first use so
+# --help and export-config start without it.
+oci = None
+
+
+def _dumps(obj) -> str:
+    """Serialize to indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# strftime formats for status-line timestamps and resource creation times
+TIMESTAMP_FORMAT = "%H:%M:%S"
+CREATED_FORMAT = "%Y-%m-%d %H:%M"
 
 
 def speak(message: str):
     """Print message with timestamp for screen readers."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {message}")
+    print(f"[{time.strftime(TIMESTAMP_FORMAT)}] {message}")
     sys.stdout.flush()
 
 
 def speak_plain(message: str):
-    """Print without timestamp."""
+    """Print without timestamp (flushed by the next status line or at exit)."""
     print(message)
+
+
+def write_lines(lines: list):
+    """Write a block of output lines with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
     sys.stdout.flush()
 
 
+def load_oci():
+    """Import the OCI SDK on first use."""
+    global oci
+    if oci is None:
+        try:
+            import oci as sdk
+        except ImportError:
+            print("Error: OCI Python SDK not installed.")
+            print("Install with: pip install oci")
+            sys.exit(1)
+        oci = sdk
+    return oci
+
+
+@lru_cache(maxsize=8)
 def get_oci_config(profile: str = "DEFAULT") -> dict:
-    """Load OCI SDK configuration."""
+    """Load OCI SDK configuration (once per profile)."""
     config_path = Path.home() / ".oci" / "config"
     if not config_path.exists():
         print(f"Error: OCI config not found at {config_path}")
         print("Run 'oci setup config' to create it.")
         sys.exit(1)
-    return oci.config.from_file(profile_name=profile)
+    return load_oci().config.from_file(profile_name=profile)
+
+
+# Lifecycle states accepted by --state (terminated resources are never listed)
+VOLUME_STATES = ["PROVISIONING", "RESTORING", "AVAILABLE", "TERMINATING", "FAULTY"]
+BACKUP_STATES = ["REQUEST_RECEIVED", "CREATING", "AVAILABLE", "TERMINATING", "FAULTY"]
+
+# Connections kept per host in the shared HTTP session
+HTTP_POOL_SIZE = 32
+
+# Concurrent requests for delete-many / backup-many
+BULK_WORKERS = 16
+
+# Retry policy for every SDK call: a few quick attempts, so throttling in a
+# wide fan-out surfaces as errors instead of minutes of silent backoff
+RETRY_MAX_ATTEMPTS = 3
+RETRY_MAX_WAIT_SECONDS = 8
+
+# Upper bound on the backoff between state polls while waiting
+WAIT_MAX_INTERVAL_SECONDS = 15
+
+
+def wait_for_state(client, response, state: str, **kwargs):
+    """Wait for a resource's lifecycle_state, announcing each poll."""
+    def announce(checks, _response):
+        speak(f"Still waiting for {state}... (check {checks})")
+
+    return oci.wait_until(
+        client,
+        response,
+        "lifecycle_state",
+        state,
+        max_interval_seconds=WAIT_MAX_INTERVAL_SECONDS,
+        wait_callback=announce,
+        **kwargs
+    )
+
+
+@lru_cache(maxsize=1)
+def get_retry_strategy():
+    """Build the shared SDK retry strategy."""
+    return load_oci().retry.RetryStrategyBuilder(
+        max_attempts_check=True,
+        max_attempts=RETRY_MAX_ATTEMPTS,
+        total_elapsed_time_check=True,
+        retry_max_wait_between_calls_seconds=RETRY_MAX_WAIT_SECONDS,
+        service_error_check=True,
+        service_error_retry_config={429: [], 500: []}
+    ).get_retry_strategy()
+
+
+class OCIClients:
+    """
+    OCI config and SDK clients for one profile, each created on first use.
+
+    All clients share one HTTP session with a connection pool large enough
+    for the concurrent fan-out used by listings and bulk operations, and
+    one retry strategy that gives up quickly under throttling.
+    """
+
+    def __init__(self, profile: str):
+        self.config = get_oci_config(profile)
+        self._ads = {}
+        self._session = None
+
+    def _make_client(self, client_class):
+        client = client_class(self.config, retry_strategy=get_retry_strategy())
+        if self._session is None:
+            session = client.base_client.session
+            # Same adapter class the SDK mounted (it vendors requests)
+            adapter_class = type(session.get_adapter("https://"))
+            session.mount("https://", adapter_class(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE
+            ))
+            self._session = session
+        else:
+            client.base_client.session = self._session
+        return client
+
+    @cached_property
+    def blockstorage(self):
+        return self._make_client(oci.core.BlockstorageClient)
+
+    @cached_property
+    def compute(self):
+        return self._make_client(oci.core.ComputeClient)
+
+    @cached_property
+    def identity(self):
+        return self._make_client(oci.identity.IdentityClient)
+
+    def availability_domains(self, compartment_id: str) -> list:
+        """List availability domains, cached per compartment."""
+        if compartment_id not in self._ads:
+            self._ads[compartment_id] = self.identity.list_availability_domains(
+                compartment_id
+            ).data
+        return self._ads[compartment_id]
+
+
+@lru_cache(maxsize=8)
+def get_clients(profile: str = "DEFAULT") -> OCIClients:
+    """Get the shared clients for a profile, reusing their HTTP sessions."""
+    return OCIClients(profile)
+
+
+def invalidate_caches():
+    """Drop cached OCI config, clients and AD lists (e.g. after 'oci setup config')."""
+    get_oci_config.cache_clear()
+    get_clients.cache_clear()
 
 
 def format_size(size_gb: int) -> str:
     """Format size for display."""
-    if size_gb >= 1024:
-        return f"{size_gb / 1024:.1f} TB"
-    return f"{size_gb} GB"
+    if size_gb < 1024:
+        return f"{size_gb} GB"
+    return f"{size_gb / 1024:.1f} TB"
+
+
+# Readable names for lifecycle states
+STATE_NAMES = {
+    "AVAILABLE": "Available",
+    "PROVISIONING": "Provisioning",
+    "TERMINATING": "Terminating",
+    "TERMINATED": "Terminated",
+    "RESTORING": "Restoring",
+    "FAULTY": "Faulty",
+}
 
 
 def format_state(state: str) -> str:
     """Format lifecycle state for readability."""
-    states = {
-        "AVAILABLE": "Available",
-        "PROVISIONING": "Provisioning",
-        "TERMINATING": "Terminating",
-        "TERMINATED": "Terminated",
-        "RESTORING": "Restoring",
-        "FAULTY": "Faulty",
-    }
-    return states.get(state, state)
+    return STATE_NAMES.get(state, state)
+
+
+def fetch_by_state(list_func, compartment_id: str, states=None) -> list:
+    """
+    Fetch all pages of a list call, optionally filtered by lifecycle state.
+
+    Filtering is done server-side, one (concurrent) request per state.
+    """
+    def fetch(state=None):
+        kwargs = {"lifecycle_state": state} if state else {}
+        # Follow pagination so large compartments aren't truncated
+        return oci.pagination.list_call_get_all_results(
+            list_func,
+            compartment_id=compartment_id,
+            **kwargs
+        ).data
 
+    if not states:
+        return fetch()
 
-def list_volumes(args):
-    """List all block volumes."""
-    speak("Fetching block volumes...")
+    results = []
+    with ThreadPoolExecutor(max_workers=len(states)) as executor:
+        for items in executor.map(fetch, states):
+            results.extend(items)
+    return results
 
-    config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(config)
-    compartment_id = args.compartment or config["tenancy"]
 
-    try:
-        response = blockstorage.list_volumes(compartment_id=compartment_id)
-        volumes = response.data
+def fetch_volumes(clients: OCIClients, compartment_id: str, states=None) -> list:
+    """Fetch block volumes in a compartment."""
+    return fetch_by_state(clients.blockstorage.list_volumes, compartment_id, states)
+
+
+def fetch_boot_volumes(clients: OCIClients, compartment_id: str) -> list:
+    """Fetch boot volumes across all availability domains."""
+    ads = clients.availability_domains(compartment_id)
+
+    def list_in_ad(ad):
+        return oci.pagination.list_call_get_all_results(
+            clients.blockstorage.list_boot_volumes,
+            availability_domain=ad.name,
+            compartment_id=compartment_id
+        ).data
+
+    # Query all ADs concurrently; map() keeps results in AD order
+    all_boot_volumes = []
+    with ThreadPoolExecutor(max_workers=max(len(ads), 1)) as executor:
+        for volumes in executor.map(list_in_ad, ads):
+            all_boot_volumes.extend(volumes)
+    return all_boot_volumes
+
+
+def fetch_backups(clients: OCIClients, compartment_id: str, states=None) -> list:
+    """Fetch volume backups in a compartment."""
+    return fetch_by_state(
+        clients.blockstorage.list_volume_backups, compartment_id, states
+    )
 
-        if not volumes:
-            speak_plain("")
-            speak_plain("No block volumes found.")
-            speak_plain("Use 'blockutil.py create --config vol.json' to create one.")
-            return
 
+# One listing entry each, followed by a blank line
+VOLUME_ROW = (
+    "  Name: {name}\n"
+    "    ID: {id}\n"
+    "    State: {state}\n"
+    "    Size: {size}\n"
+    "    Performance: {vpus} VPUs/GB\n"
+    "    Availability Domain: {ad}\n"
+    "    Created: {created}\n"
+)
+BOOT_VOLUME_ROW = (
+    "  Name: {name}\n"
+    "    ID: {id}\n"
+    "    State: {state}\n"
+    "    Size: {size}\n"
+    "    Image ID: {image}\n"
+    "    Availability Domain: {ad}\n"
+)
+BACKUP_ROW = (
+    "  Name: {name}\n"
+    "    ID: {id}\n"
+    "    State: {state}\n"
+    "    Size: {size}\n"
+    "    Type: {type}\n"
+    "    Source Volume: {volume}\n"
+    "    Created: {created}\n"
+)
+
+
+def print_volumes(volumes: list):
+    """Print a block volume listing."""
+    if not volumes:
         speak_plain("")
-        speak_plain("Block Volumes")
-        speak_plain("=" * 70)
+        speak_plain("No block volumes found.")
+        speak_plain("Use 'blockutil.py create --config vol.json' to create one.")
+        return
+
+    lines = ["", "Block Volumes", "=" * 70, ""]
+
+    total_size = 0
+    active_count = 0
+    available = 0
+
+    for vol in volumes:
+        if vol.lifecycle_state == "TERMINATED":
+            continue
+        active_count += 1
+
+        lines.append(VOLUME_ROW.format(
+            name=vol.display_name,
+            id=vol.id,
+            state=format_state(vol.lifecycle_state),
+            size=format_size(vol.size_in_gbs),
+            vpus=vol.vpus_per_gb,
+            ad=vol.availability_domain,
+            created=vol.time_created.strftime(CREATED_FORMAT)
+        ))
+
+        total_size += vol.size_in_gbs
+        if vol.lifecycle_state == "AVAILABLE":
+            available += 1
+
+    lines.append(f"Total: {active_count} volumes, {format_size(total_size)} total storage")
+    lines.append(f"Available: {available} volumes")
+    write_lines(lines)
+
+
+def print_boot_volumes(boot_volumes: list):
+    """Print a boot volume listing."""
+    if not boot_volumes:
         speak_plain("")
+        speak_plain("No boot volumes found.")
+        return
 
-        total_size = 0
-        available = 0
+    lines = ["", "Boot Volumes", "=" * 70, ""]
 
-        for vol in volumes:
-            if vol.lifecycle_state == "TERMINATED":
-                continue
+    total_size = 0
+    active_count = 0
 
-            speak_plain(f"  Name: {vol.display_name}")
-            speak_plain(f"    ID: {vol.id}")
-            speak_plain(f"    State: {format_state(vol.lifecycle_state)}")
-            speak_plain(f"    Size: {format_size(vol.size_in_gbs)}")
-            speak_plain(f"    Performance: {vol.vpus_per_gb} VPUs/GB")
-            speak_plain(f"    Availability Domain: {vol.availability_domain}")
-            speak_plain(f"    Created: {vol.time_created.strftime('%Y-%m-%d %H:%M')}")
-            speak_plain("")
+    for vol in boot_volumes:
+        if vol.lifecycle_state == "TERMINATED":
+            continue
+        active_count += 1
+
+        lines.append(BOOT_VOLUME_ROW.format(
+            name=vol.display_name,
+            id=vol.id,
+            state=format_state(vol.lifecycle_state),
+            size=format_size(vol.size_in_gbs),
+            image=vol.image_id,
+            ad=vol.availability_domain
+        ))
+
+        total_size += vol.size_in_gbs
+
+    lines.append(f"Total: {active_count} boot volumes, {format_size(total_size)} total storage")
+    write_lines(lines)
+
+
+def print_backups(backups: list):
+    """Print a volume backup listing."""
+    if not backups:
+        speak_plain("")
+        speak_plain("No volume backups found.")
+        speak_plain("Use 'blockutil.py backup <volume-id>' to create one.")
+        return
 
-            total_size += vol.size_in_gbs
-            if vol.lifecycle_state == "AVAILABLE":
-                available += 1
+    lines = ["", "Volume Backups", "=" * 70, ""]
 
-        active_count = len([v for v in volumes if v.lifecycle_state != "TERMINATED"])
-        speak_plain(f"Total: {active_count} volumes, {format_size(total_size)} total storage")
-        speak_plain(f"Available: {available} volumes")
+    total_size = 0
+    active_count = 0
 
+    for backup in backups:
+        if backup.lifecycle_state == "TERMINATED":
+            continue
+        active_count += 1
+
+        lines.append(BACKUP_ROW.format(
+            name=backup.display_name,
+            id=backup.id,
+            state=format_state(backup.lifecycle_state),
+            size=format_size(backup.size_in_gbs) if backup.size_in_gbs else "N/A",
+            type=backup.type,
+            volume=backup.volume_id,
+            created=backup.time_created.strftime(CREATED_FORMAT)
+        ))
+
+        if backup.size_in_gbs:
+            total_size += backup.size_in_gbs
+
+    lines.append(f"Total: {active_count} backups, {format_size(total_size)} total storage")
+    write_lines(lines)
+
+
+def list_volumes(args):
+    """List all block volumes."""
+    speak("Fetching block volumes...")
+
+    clients = get_clients(args.profile)
+    compartment_id = args.compartment or clients.config["tenancy"]
+
+    try:
+        print_volumes(fetch_volumes(clients, compartment_id, args.state))
     except oci.exceptions.ServiceError as e:
         print(f"Error: {e.message}")
         sys.exit(1)
@@ -131,52 +438,33 @@ def list_boot_volumes(args):
     """List all boot volumes."""
     speak("Fetching boot volumes...")
 
-    config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(config)
-    identity = oci.identity.IdentityClient(config)
-    compartment_id = args.compartment or config["tenancy"]
+    clients = get_clients(args.profile)
+    compartment_id = args.compartment or clients.config["tenancy"]
 
     try:
-        # Get availability domains
-        ads = identity.list_availability_domains(compartment_id).data
-
-        all_boot_volumes = []
-        for ad in ads:
-            response = blockstorage.list_boot_volumes(
-                availability_domain=ad.name,
-                compartment_id=compartment_id
-            )
-            all_boot_volumes.extend(response.data)
-
-        if not all_boot_volumes:
-            speak_plain("")
-            speak_plain("No boot volumes found.")
-            return
-
-        speak_plain("")
-        speak_plain("Boot Volumes")
-        speak_plain("=" * 70)
-        speak_plain("")
-
-        total_size = 0
-
-        for vol in all_boot_volumes:
-            if vol.lifecycle_state == "TERMINATED":
-                continue
+        print_boot_volumes(fetch_boot_volumes(clients, compartment_id))
+    except oci.exceptions.ServiceError as e:
+        print(f"Error: {e.message}")
+        sys.exit(1)
 
-            speak_plain(f"  Name: {vol.display_name}")
-            speak_plain(f"    ID: {vol.id}")
-            speak_plain(f"    State: {format_state(vol.lifecycle_state)}")
-            speak_plain(f"    Size: {format_size(vol.size_in_gbs)}")
-            speak_plain(f"    Image ID: {vol.image_id}")
-            speak_plain(f"    Availability Domain: {vol.availability_domain}")
-            speak_plain("")
 
-            total_size += vol.size_in_gbs
+def list_all(args):
+    """List block volumes, boot volumes and backups, fetched concurrently."""
+    speak("Fetching block volumes, boot volumes and backups...")
 
-        active_count = len([v for v in all_boot_volumes if v.lifecycle_state != "TERMINATED"])
-        speak_plain(f"Total: {active_count} boot volumes, {format_size(total_size)} total storage")
+    clients = get_clients(args.profile)
+    compartment_id = args.compartment or clients.config["tenancy"]
 
+    try:
+        # The three listings are independent; fetch together, print in order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            volumes = executor.submit(fetch_volumes, clients, compartment_id)
+            boot_volumes = executor.submit(fetch_boot_volumes, clients, compartment_id)
+            backups = executor.submit(fetch_backups, clients, compartment_id)
+
+            print_volumes(volumes.result())
+            print_boot_volumes(boot_volumes.result())
+            print_backups(backups.result())
     except oci.exceptions.ServiceError as e:
         print(f"Error: {e.message}")
         sys.exit(1)
@@ -186,12 +474,34 @@ def show_volume(args):
     """Show detailed volume information."""
     speak(f"Fetching volume {args.volume_id}...")
 
-    config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(config)
-    compute = oci.core.ComputeClient(config)
+    clients = get_clients(args.profile)
+    blockstorage = clients.blockstorage
+    compute = clients.compute
+
+    # The attachment lookup needs the volume's compartment; guess it (from
+    # --compartment or the tenancy) so both requests can run together, and
+    # only repeat the lookup if the guess turns out to be wrong.
+    guessed_compartment = args.compartment or clients.config["tenancy"]
 
     try:
-        volume = blockstorage.get_volume(args.volume_id).data
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            volume_future = executor.submit(blockstorage.get_volume, args.volume_id)
+            attachments_future = executor.submit(
+                compute.list_volume_attachments,
+                compartment_id=guessed_compartment,
+                volume_id=args.volume_id
+            )
+            volume = volume_future.result().data
+            try:
+                attachments = attachments_future.result().data
+            except oci.exceptions.ServiceError:
+                attachments = None
+
+        if attachments is None or volume.compartment_id != guessed_compartment:
+            attachments = compute.list_volume_attachments(
+                compartment_id=volume.compartment_id,
+                volume_id=volume.id
+            ).data
 
         speak_plain("")
         speak_plain("Block Volume Details")
@@ -213,11 +523,6 @@ def show_volume(args):
         speak_plain("")
         speak_plain("  Attachments:")
 
-        attachments = compute.list_volume_attachments(
-            compartment_id=volume.compartment_id,
-            volume_id=volume.id
-        ).data
-
         attached = [a for a in attachments if a.lifecycle_state == "ATTACHED"]
         if attached:
             for att in attached:
@@ -251,8 +556,8 @@ def create_volume(args):
         print(f"Error: Config file not found: {args.config}")
         sys.exit(1)
 
-    with open(config_path) as f:
-        vol_config = json.load(f)
+    with open(config_path, "rb") as f:
+        vol_config = _loads(f.read())
 
     # Validate required fields
     required = ["display_name", "compartment_id", "availability_domain", "size_in_gbs"]
@@ -263,23 +568,17 @@ def create_volume(args):
 
     speak(f"Creating volume: {vol_config['display_name']}")
 
-    oci_config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(oci_config)
-    identity = oci.identity.IdentityClient(oci_config)
+    clients = get_clients(args.profile)
+    blockstorage = clients.blockstorage
 
     try:
         # Get availability domain
         ad = vol_config["availability_domain"]
-        if not ad.startswith("ocid") and not ":" in ad:
-            ads = identity.list_availability_domains(vol_config["compartment_id"]).data
-            if ad.upper().startswith("AD-"):
-                ad_num = int(ad.split("-")[1]) - 1
-                if ad_num < len(ads):
-                    ad = ads[ad_num].name
-                else:
-                    ad = ads[0].name
-            else:
-                ad = ads[0].name
+        if not ad.startswith("ocid") and ":" not in ad:
+            # Short form such as "AD-2"; anything else falls back to the first AD
+            ads = clients.availability_domains(vol_config["compartment_id"])
+            ad_num = int(ad[3:]) - 1 if ad[:3].upper() == "AD-" else 0
+            ad = ads[ad_num].name if 0 <= ad_num < len(ads) else ads[0].name
 
         create_details = oci.core.models.CreateVolumeDetails(
             compartment_id=vol_config["compartment_id"],
@@ -303,10 +602,9 @@ def create_volume(args):
 
         if args.wait:
             speak("Waiting for volume to be available...")
-            volume = oci.wait_until(
+            volume = wait_for_state(
                 blockstorage,
                 blockstorage.get_volume(volume.id),
-                "lifecycle_state",
                 "AVAILABLE",
                 max_wait_seconds=300
             ).data
@@ -323,8 +621,8 @@ def attach_volume(args):
     """Attach volume to instance."""
     speak(f"Attaching volume {args.volume_id} to instance {args.instance_id}...")
 
-    config = get_oci_config(args.profile)
-    compute = oci.core.ComputeClient(config)
+    clients = get_clients(args.profile)
+    compute = clients.compute
 
     try:
         # Determine attachment type
@@ -358,10 +656,9 @@ def attach_volume(args):
 
         if args.wait:
             speak("Waiting for attachment to complete...")
-            attachment = oci.wait_until(
+            attachment = wait_for_state(
                 compute,
                 compute.get_volume_attachment(attachment.id),
-                "lifecycle_state",
                 "ATTACHED",
                 max_wait_seconds=300
             ).data
@@ -377,8 +674,8 @@ def detach_volume(args):
     """Detach volume from instance."""
     speak(f"Detaching volume attachment {args.attachment_id}...")
 
-    config = get_oci_config(args.profile)
-    compute = oci.core.ComputeClient(config)
+    clients = get_clients(args.profile)
+    compute = clients.compute
 
     try:
         compute.detach_volume(args.attachment_id)
@@ -386,10 +683,9 @@ def detach_volume(args):
 
         if args.wait:
             speak("Waiting for detachment to complete...")
-            oci.wait_until(
+            wait_for_state(
                 compute,
                 compute.get_volume_attachment(args.attachment_id),
-                "lifecycle_state",
                 "DETACHED",
                 max_wait_seconds=300
             )
@@ -404,8 +700,8 @@ def resize_volume(args):
     """Resize a block volume."""
     speak(f"Resizing volume {args.volume_id} to {args.size_gb} GB...")
 
-    config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(config)
+    clients = get_clients(args.profile)
+    blockstorage = clients.blockstorage
 
     try:
         # Get current volume
@@ -430,10 +726,9 @@ def resize_volume(args):
 
         if args.wait:
             speak("Waiting for resize to complete...")
-            volume = oci.wait_until(
+            volume = wait_for_state(
                 blockstorage,
                 blockstorage.get_volume(args.volume_id),
-                "lifecycle_state",
                 "AVAILABLE",
                 max_wait_seconds=600
             ).data
@@ -457,8 +752,8 @@ def delete_volume(args):
             speak("Deletion cancelled.")
             return
 
-    config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(config)
+    clients = get_clients(args.profile)
+    blockstorage = clients.blockstorage
 
     try:
         blockstorage.delete_volume(args.volume_id)
@@ -466,10 +761,9 @@ def delete_volume(args):
 
         if args.wait:
             speak("Waiting for deletion to complete...")
-            oci.wait_until(
+            wait_for_state(
                 blockstorage,
                 blockstorage.get_volume(args.volume_id),
-                "lifecycle_state",
                 "TERMINATED",
                 max_wait_seconds=300,
                 succeed_on_not_found=True
@@ -481,28 +775,34 @@ def delete_volume(args):
         sys.exit(1)
 
 
+def start_backup(blockstorage, volume_id: str, backup_type: str = None, name: str = None):
+    """Start a backup of a volume, named after the volume unless name is given."""
+    # Get volume details for naming
+    volume = blockstorage.get_volume(volume_id).data
+    backup_name = name or f"{volume.display_name}-backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
+    backup_details = oci.core.models.CreateVolumeBackupDetails(
+        volume_id=volume_id,
+        display_name=backup_name,
+        type=backup_type or "INCREMENTAL",
+        freeform_tags=volume.freeform_tags or {}
+    )
+
+    return blockstorage.create_volume_backup(backup_details).data
+
+
 def create_backup(args):
     """Create a volume backup."""
     speak(f"Creating backup of volume {args.volume_id}...")
 
-    config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(config)
+    clients = get_clients(args.profile)
+    blockstorage = clients.blockstorage
 
     try:
-        # Get volume details for naming
-        volume = blockstorage.get_volume(args.volume_id).data
-        backup_name = args.name or f"{volume.display_name}-backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-
-        backup_details = oci.core.models.CreateVolumeBackupDetails(
-            volume_id=args.volume_id,
-            display_name=backup_name,
-            type=args.backup_type or "INCREMENTAL",
-            freeform_tags=volume.freeform_tags or {}
+        backup = start_backup(
+            blockstorage, args.volume_id, args.backup_type, args.name
         )
 
-        response = blockstorage.create_volume_backup(backup_details)
-        backup = response.data
-
         speak("Backup creation initiated!")
         speak_plain("")
         speak_plain(f"  Backup ID: {backup.id}")
@@ -513,10 +813,9 @@ def create_backup(args):
         if args.wait:
             speak("Waiting for backup to complete...")
             speak("This may take several minutes depending on volume size.")
-            backup = oci.wait_until(
+            backup = wait_for_state(
                 blockstorage,
                 blockstorage.get_volume_backup(backup.id),
-                "lifecycle_state",
                 "AVAILABLE",
                 max_wait_seconds=3600
             ).data
@@ -527,50 +826,96 @@ def create_backup(args):
         sys.exit(1)
 
 
-def list_backups(args):
-    """List all volume backups."""
-    speak("Fetching volume backups...")
+def read_ocids(path: str) -> list:
+    """Read OCIDs from a file ('-' for stdin): whitespace separated, # comments."""
+    text = sys.stdin.read() if path == "-" else Path(path).expanduser().read_text()
+    ocids = []
+    for line in text.splitlines():
+        ocids.extend(line.split("#", 1)[0].split())
+    # Drop duplicates, keeping file order
+    return list(dict.fromkeys(ocids))
+
+
+def run_bulk(action, ocids: list) -> int:
+    """Run action(ocid) concurrently, announcing each result. Returns failure count."""
+    failures = 0
+    with ThreadPoolExecutor(max_workers=min(BULK_WORKERS, len(ocids))) as executor:
+        futures = {executor.submit(action, ocid): ocid for ocid in ocids}
+
+        for future in as_completed(futures):
+            ocid = futures[future]
+            try:
+                speak(f"{ocid}: {future.result()}")
+            except oci.exceptions.ServiceError as e:
+                failures += 1
+                speak(f"FAILED {ocid}: {e.message}")
+            except Exception as e:
+                failures += 1
+                speak(f"FAILED {ocid}: {e}")
+
+    speak(f"Done: {len(ocids) - failures} succeeded, {failures} failed.")
+    return failures
+
+
+def delete_many(args):
+    """Delete every block volume listed in a file."""
+    if args.file == "-" and not args.yes:
+        # stdin is consumed by the OCID list, leaving nothing to confirm with
+        print("Error: reading volume OCIDs from stdin requires --yes")
+        sys.exit(1)
 
-    config = get_oci_config(args.profile)
-    blockstorage = oci.core.BlockstorageClient(config)
-    compartment_id = args.compartment or config["tenancy"]
+    ocids = read_ocids(args.file)
+    if not ocids:
+        speak(f"No volume OCIDs found in {args.file}.")
+        return
 
-    try:
-        response = blockstorage.list_volume_backups(compartment_id=compartment_id)
-        backups = response.data
+    speak(f"WARNING: Deleting {len(ocids)} volumes")
+    speak("This action is PERMANENT and cannot be undone!")
 
-        if not backups:
-            speak_plain("")
-            speak_plain("No volume backups found.")
-            speak_plain("Use 'blockutil.py backup <volume-id>' to create one.")
+    if not args.yes:
+        confirm = input(f"Type 'yes' to confirm deletion of {len(ocids)} volumes: ")
+        if confirm.lower() != "yes":
+            speak("Deletion cancelled.")
             return
 
-        speak_plain("")
-        speak_plain("Volume Backups")
-        speak_plain("=" * 70)
-        speak_plain("")
+    blockstorage = get_clients(args.profile).blockstorage
 
-        total_size = 0
+    def delete(volume_id):
+        blockstorage.delete_volume(volume_id)
+        return "deletion initiated"
 
-        for backup in backups:
-            if backup.lifecycle_state == "TERMINATED":
-                continue
+    if run_bulk(delete, ocids):
+        sys.exit(1)
 
-            speak_plain(f"  Name: {backup.display_name}")
-            speak_plain(f"    ID: {backup.id}")
-            speak_plain(f"    State: {format_state(backup.lifecycle_state)}")
-            speak_plain(f"    Size: {format_size(backup.size_in_gbs) if backup.size_in_gbs else 'N/A'}")
-            speak_plain(f"    Type: {backup.type}")
-            speak_plain(f"    Source Volume: {backup.volume_id}")
-            speak_plain(f"    Created: {backup.time_created.strftime('%Y-%m-%d %H:%M')}")
-            speak_plain("")
 
-            if backup.size_in_gbs:
-                total_size += backup.size_in_gbs
+def backup_many(args):
+    """Back up every block volume listed in a file."""
+    ocids = read_ocids(args.file)
+    if not ocids:
+        speak(f"No volume OCIDs found in {args.file}.")
+        return
 
-        active_count = len([b for b in backups if b.lifecycle_state != "TERMINATED"])
-        speak_plain(f"Total: {active_count} backups, {format_size(total_size)} total storage")
+    speak(f"Creating backups of {len(ocids)} volumes...")
+
+    blockstorage = get_clients(args.profile).blockstorage
+
+    def backup(volume_id):
+        backup = start_backup(blockstorage, volume_id, args.backup_type)
+        return f"backup {backup.display_name} initiated ({backup.id})"
+
+    if run_bulk(backup, ocids):
+        sys.exit(1)
 
+
+def list_backups(args):
+    """List all volume backups."""
+    speak("Fetching volume backups...")
+
+    clients = get_clients(args.profile)
+    compartment_id = args.compartment or clients.config["tenancy"]
+
+    try:
+        print_backups(fetch_backups(clients, compartment_id, args.state))
     except oci.exceptions.ServiceError as e:
         print(f"Error: {e.message}")
         sys.exit(1)
@@ -601,7 +946,7 @@ def export_config(args):
 
     output_path = Path(args.output).expanduser()
     with open(output_path, "w") as f:
-        json.dump(template, f, indent=2)
+        f.write(_dumps(template))
 
     speak_plain(f"Configuration template saved to: {args.output}")
     speak_plain("")
@@ -619,6 +964,7 @@ def main():
 Examples:
     blockutil.py list                          # List block volumes
     blockutil.py list-boot                     # List boot volumes
+    blockutil.py list-all                      # Volumes, boot volumes, backups
     blockutil.py show ocid1.volume...          # Show volume details
     blockutil.py create --config vol.json      # Create volume
     blockutil.py attach <vol-id> <inst-id>     # Attach to instance
@@ -626,6 +972,8 @@ Examples:
     blockutil.py resize <vol-id> 200           # Resize to 200 GB
     blockutil.py delete <vol-id>               # Delete volume
     blockutil.py backup <vol-id>               # Create backup
+    blockutil.py backup-many volumes.txt       # Back up listed volumes
+    blockutil.py delete-many volumes.txt       # Delete listed volumes
     blockutil.py backups                       # List backups
 
 Screen Reader Notes:
@@ -649,12 +997,22 @@ Screen Reader Notes:
 
     # list
     list_parser = subparsers.add_parser("list", help="List block volumes")
+    list_parser.add_argument(
+        "--state", action="append", choices=VOLUME_STATES,
+        help="Only show volumes in this state (repeatable)"
+    )
     list_parser.set_defaults(func=list_volumes)
 
     # list-boot
     list_boot_parser = subparsers.add_parser("list-boot", help="List boot volumes")
     list_boot_parser.set_defaults(func=list_boot_volumes)
 
+    # list-all
+    list_all_parser = subparsers.add_parser(
+        "list-all", help="List volumes, boot volumes and backups together"
+    )
+    list_all_parser.set_defaults(func=list_all)
+
     # show
     show_parser = subparsers.add_parser("show", help="Show volume details")
     show_parser.add_argument("volume_id", help="Volume OCID")
@@ -705,8 +1063,28 @@ Screen Reader Notes:
     backup_parser.add_argument("--wait", "-w", action="store_true", help="Wait for backup")
     backup_parser.set_defaults(func=create_backup)
 
+    # delete-many
+    delete_many_parser = subparsers.add_parser(
+        "delete-many", help="Delete volumes listed in a file"
+    )
+    delete_many_parser.add_argument("file", help="File of volume OCIDs ('-' for stdin, requires --yes)")
+    delete_many_parser.add_argument("--yes", "-y", action="store_true", help="Skip confirmation")
+    delete_many_parser.set_defaults(func=delete_many)
+
+    # backup-many
+    backup_many_parser = subparsers.add_parser(
+        "backup-many", help="Back up volumes listed in a file"
+    )
+    backup_many_parser.add_argument("file", help="File of volume OCIDs ('-' for stdin)")
+    backup_many_parser.add_argument("--backup-type", choices=["FULL", "INCREMENTAL"], default="INCREMENTAL")
+    backup_many_parser.set_defaults(func=backup_many)
+
     # backups
     backups_parser = subparsers.add_parser("backups", help="List volume backups")
+    backups_parser.add_argument(
+        "--state", action="append", choices=BACKUP_STATES,
+        help="Only show backups in this state (repeatable)"
+    )
     backups_parser.set_defaults(func=list_backups)
 
     # export-config
@@ -13,6 +13,7 @@ Usage:
     cloudtop.py --running                  # Running resources only
     cloudtop.py --json                     # JSON output
     cloudtop.py --refresh 30               # Auto-refresh every 30s
+    cloudtop.py --refresh 30 --changes     # Only report what changed
     cloudtop.py init                       # Generate config file
 """
 
@@ -20,13 +21,27 @@ import argparse
 import json
 import os
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Import centralized config
 try:
     from adsops_config import get_config, Config
@@ -38,6 +53,33 @@ except ImportError:
 # Legacy config path (deprecated - use ~/.adsops_config/config.json)
 LEGACY_CONFIG_PATH = Path.home() / ".cloudtop.json"
 
+# Connections kept per host in the shared HTTP session
+HTTP_POOL_SIZE = 32
+
+# (connect, read) timeout for provider API calls, so one hung endpoint
+# can't stall the whole collection
+HTTP_TIMEOUT = (3.05, 10)
+
+# Responses larger than this are parsed incrementally when ijson is installed
+STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+# With --changes, the full table is still printed every this many ticks
+FULL_TABLE_EVERY = 10
+
+# In --refresh mode, cached listings older than this many refresh intervals
+# are refetched before display instead of served stale
+SWR_STALE_LIMIT = 10
+
+
+def _dumps(obj) -> str:
+    """Serialize to indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 def speak(message: str):
     """Print message with timestamp for screen readers."""
@@ -47,13 +89,126 @@ def speak(message: str):
 
 
 def speak_plain(message: str):
-    """Print without timestamp."""
+    """Print without timestamp (flushed by the next status line or at exit)."""
     print(message)
+
+
+def write_lines(lines: list):
+    """Write a block of output lines with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
     sys.stdout.flush()
 
 
+@lru_cache(maxsize=1)
+def get_executor() -> ThreadPoolExecutor:
+    """Worker pool for provider calls, kept across --refresh ticks."""
+    return ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="cloudtop")
+
+
+@lru_cache(maxsize=1)
+def get_request_executor() -> ThreadPoolExecutor:
+    """
+    Worker pool for concurrent HTTP requests made within one provider.
+
+    Kept apart from get_executor() so a provider waiting on its own
+    requests can never starve the pool it is running on.
+    """
+    return ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="cloudtop-http")
+
+
+@lru_cache(maxsize=1)
+def get_session():
+    """HTTP session shared by all providers, with pooled keep-alive connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    ))
+    return session
+
+
+def iter_json_items(response, key: str):
+    """
+    Yield the items of the top-level JSON array at key, if the request succeeded.
+
+    Responses over STREAM_THRESHOLD_BYTES are parsed incrementally with ijson
+    when it is installed, so memory is bounded by one item rather than the
+    whole body. The response must be requested with stream=True.
+    """
+    try:
+        if not response.ok:
+            return
+        size = int(response.headers.get("Content-Length") or 0)
+        if ijson is not None and size > STREAM_THRESHOLD_BYTES:
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+        else:
+            yield from _loads(response.content).get(key, [])
+    finally:
+        response.close()
+
+
+class SWRCache:
+    """
+    Stale-while-revalidate cache for provider listings in --refresh mode.
+
+    Entries younger than max_age are served as-is. Older ones are served
+    immediately while a background refresh replaces them, unless they are
+    past SWR_STALE_LIMIT intervals old, in which case the caller waits.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self._executor = executor
+        self._entries = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def get(self, key, fetch, max_age: float):
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            return self._refresh(key, fetch)
+
+        value, fetched_at = entry
+        age = time.monotonic() - fetched_at
+        if age >= max_age * SWR_STALE_LIMIT:
+            return self._refresh(key, fetch)
+
+        if age >= max_age:
+            with self._lock:
+                start = key not in self._pending
+                self._pending.add(key)
+            if start:
+                self._executor.submit(self._refresh, key, fetch)
+
+        return value
+
+    def _refresh(self, key, fetch):
+        try:
+            value = fetch()
+            with self._lock:
+                self._entries[key] = (value, time.monotonic())
+            return value
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+
 class Resource:
-    """Represents a cloud resource."""
+    """
+    Represents a cloud resource.
+
+    Providers intern status strings, so the thousands of resources in a
+    large listing share a handful of status objects.
+    """
+    __slots__ = ("name", "type", "status", "region", "provider", "extra")
+
     def __init__(self, name: str, resource_type: str, status: str,
                  region: str = "", provider: str = "", **kwargs):
         self.name = name
@@ -74,6 +229,13 @@ class Resource:
         }
 
 
+@lru_cache(maxsize=8)
+def load_oci_config(profile: str) -> dict:
+    """Load OCI SDK configuration (once per profile)."""
+    import oci
+    return oci.config.from_file(profile_name=profile)
+
+
 class Provider(ABC):
     """Base class for cloud providers."""
 
@@ -105,7 +267,7 @@ class OracleProvider(Provider):
         try:
             import oci
             profile = config.get("profile", "DEFAULT")
-            self.oci_config = oci.config.from_file(profile_name=profile)
+            self.oci_config = load_oci_config(profile)
             self.compute_client = oci.core.ComputeClient(self.oci_config)
             self.compartment_id = config.get("compartment_id") or self.oci_config["tenancy"]
             return True
@@ -118,21 +280,25 @@ class OracleProvider(Provider):
         filters = filters or {}
 
         try:
-            instances = self.compute_client.list_instances(
-                compartment_id=self.compartment_id
+            import oci
+
+            # Let the service filter by state; recently terminated
+            # instances are still listed when unfiltered
+            kwargs = {"lifecycle_state": "RUNNING"} if filters.get("running") else {}
+            instances = oci.pagination.list_call_get_all_results(
+                self.compute_client.list_instances,
+                compartment_id=self.compartment_id,
+                **kwargs
             ).data
 
             for inst in instances:
                 if inst.lifecycle_state == "TERMINATED":
                     continue
 
-                if filters.get("running") and inst.lifecycle_state != "RUNNING":
-                    continue
-
                 resources.append(Resource(
                     name=inst.display_name,
                     resource_type="compute",
-                    status=inst.lifecycle_state.lower(),
+                    status=sys.intern(inst.lifecycle_state.lower()),
                     region=inst.region,
                     provider=self.name,
                     shape=inst.shape,
@@ -155,8 +321,7 @@ class CloudflareProvider(Provider):
 
     def initialize(self, config: dict) -> bool:
         try:
-            import requests
-            self.session = requests.Session()
+            self.session = get_session()
             self.api_token = config.get("api_token") or os.environ.get("CLOUDFLARE_API_TOKEN")
             self.account_id = config.get("account_id") or os.environ.get("CLOUDFLARE_ACCOUNT_ID")
 
@@ -164,27 +329,35 @@ class CloudflareProvider(Provider):
                 speak("Cloudflare: No API token configured")
                 return False
 
-            self.session.headers.update({
+            self.headers = {
                 "Authorization": f"Bearer {self.api_token}",
                 "Content-Type": "application/json"
-            })
+            }
             return True
         except Exception as e:
             speak(f"Cloudflare init failed: {e}")
             return False
 
+    def _get(self, url: str):
+        return self.session.get(url, headers=self.headers, timeout=HTTP_TIMEOUT)
+
     def list_resources(self, filters: dict = None) -> List[Resource]:
         resources = []
         filters = filters or {}
 
         try:
-            # List Workers
             if self.account_id:
-                response = self.session.get(
-                    f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}/workers/scripts"
+                base_url = f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}"
+
+                # Workers and R2 are independent endpoints; fetch both at once
+                workers_response, r2_response = get_request_executor().map(
+                    self._get,
+                    [f"{base_url}/workers/scripts", f"{base_url}/r2/buckets"]
                 )
-                if response.ok:
-                    data = response.json()
+
+                # List Workers
+                if workers_response.ok:
+                    data = _loads(workers_response.content)
                     for worker in data.get("result", []):
                         resources.append(Resource(
                             name=worker.get("id", "unknown"),
@@ -195,11 +368,8 @@ class CloudflareProvider(Provider):
                         ))
 
                 # List R2 buckets
-                response = self.session.get(
-                    f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}/r2/buckets"
-                )
-                if response.ok:
-                    data = response.json()
+                if r2_response.ok:
+                    data = _loads(r2_response.content)
                     for bucket in data.get("result", {}).get("buckets", []):
                         resources.append(Resource(
                             name=bucket.get("name", "unknown"),
@@ -224,18 +394,17 @@ class NeonProvider(Provider):
 
     def initialize(self, config: dict) -> bool:
         try:
-            import requests
-            self.session = requests.Session()
+            self.session = get_session()
             self.api_key = config.get("api_key") or os.environ.get("NEON_API_KEY")
 
             if not self.api_key:
                 speak("Neon: No API key configured")
                 return False
 
-            self.session.headers.update({
+            self.headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
-            })
+            }
             return True
         except Exception as e:
             speak(f"Neon init failed: {e}")
@@ -244,25 +413,29 @@ class NeonProvider(Provider):
     def list_resources(self, filters: dict = None) -> List[Resource]:
         resources = []
         filters = filters or {}
+        running_only = bool(filters.get("running"))
 
         try:
-            response = self.session.get("https://console.neon.tech/api/v2/projects")
-            if response.ok:
-                data = response.json()
-                for project in data.get("projects", []):
-                    status = "active" if project.get("active_time_seconds", 0) > 0 else "idle"
+            response = self.session.get(
+                "https://console.neon.tech/api/v2/projects",
+                headers=self.headers,
+                timeout=HTTP_TIMEOUT,
+                stream=True
+            )
+            for project in iter_json_items(response, "projects"):
+                status = "active" if project.get("active_time_seconds", 0) > 0 else "idle"
 
-                    if filters.get("running") and status != "active":
-                        continue
+                if running_only and status != "active":
+                    continue
 
-                    resources.append(Resource(
-                        name=project.get("name", "unknown"),
-                        resource_type="postgres",
-                        status=status,
-                        region=project.get("region_id", "unknown"),
-                        provider=self.name,
-                        pg_version=project.get("pg_version")
-                    ))
+                resources.append(Resource(
+                    name=project.get("name", "unknown"),
+                    resource_type="postgres",
+                    status=status,
+                    region=project.get("region_id", "unknown"),
+                    provider=self.name,
+                    pg_version=project.get("pg_version")
+                ))
 
         except Exception as e:
             speak(f"Neon error: {e}")
@@ -279,17 +452,16 @@ class VastAIProvider(Provider):
 
     def initialize(self, config: dict) -> bool:
         try:
-            import requests
-            self.session = requests.Session()
+            self.session = get_session()
             self.api_key = config.get("api_key") or os.environ.get("VASTAI_API_KEY")
 
             if not self.api_key:
                 speak("Vast.ai: No API key configured")
                 return False
 
-            self.session.headers.update({
+            self.headers = {
                 "Accept": "application/json"
-            })
+            }
             return True
         except Exception as e:
             speak(f"Vast.ai init failed: {e}")
@@ -298,30 +470,32 @@ class VastAIProvider(Provider):
     def list_resources(self, filters: dict = None) -> List[Resource]:
         resources = []
         filters = filters or {}
+        running_only = bool(filters.get("running"))
 
         try:
             response = self.session.get(
                 "https://console.vast.ai/api/v0/instances/",
-                params={"api_key": self.api_key}
+                params={"api_key": self.api_key},
+                headers=self.headers,
+                timeout=HTTP_TIMEOUT,
+                stream=True
             )
-            if response.ok:
-                data = response.json()
-                for instance in data.get("instances", []):
-                    status = instance.get("actual_status", "unknown")
+            for instance in iter_json_items(response, "instances"):
+                status = sys.intern(instance.get("actual_status") or "unknown")
 
-                    if filters.get("running") and status != "running":
-                        continue
+                if running_only and status != "running":
+                    continue
 
-                    resources.append(Resource(
-                        name=f"instance-{instance.get('id')}",
-                        resource_type="gpu",
-                        status=status,
-                        region=instance.get("geolocation", "unknown"),
-                        provider=self.name,
-                        gpu_name=instance.get("gpu_name"),
-                        num_gpus=instance.get("num_gpus"),
-                        dph_total=instance.get("dph_total")
-                    ))
+                resources.append(Resource(
+                    name=f"instance-{instance.get('id')}",
+                    resource_type="gpu",
+                    status=status,
+                    region=instance.get("geolocation", "unknown"),
+                    provider=self.name,
+                    gpu_name=instance.get("gpu_name"),
+                    num_gpus=instance.get("num_gpus"),
+                    dph_total=instance.get("dph_total")
+                ))
 
         except Exception as e:
             speak(f"Vast.ai error: {e}")
@@ -329,6 +503,37 @@ class VastAIProvider(Provider):
         return resources
 
 
+# Pods, serverless endpoints and network volumes, with only the fields
+# cloudtop displays
+RUNPOD_QUERY = """
+query {
+    myself {
+        pods {
+            id
+            name
+            desiredStatus
+            runtime {
+                gpuCount
+            }
+            machine {
+                gpuDisplayName
+            }
+        }
+        endpoints {
+            id
+            name
+        }
+        networkVolumes {
+            id
+            name
+            size
+            dataCenterId
+        }
+    }
+}
+"""
+
+
 class RunPodProvider(Provider):
     """RunPod GPU provider."""
 
@@ -338,18 +543,17 @@ class RunPodProvider(Provider):
 
     def initialize(self, config: dict) -> bool:
         try:
-            import requests
-            self.session = requests.Session()
+            self.session = get_session()
             self.api_key = config.get("api_key") or os.environ.get("RUNPOD_API_KEY")
 
             if not self.api_key:
                 speak("RunPod: No API key configured")
                 return False
 
-            self.session.headers.update({
+            self.headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
-            })
+            }
             return True
         except Exception as e:
             speak(f"RunPod init failed: {e}")
@@ -358,38 +562,24 @@ class RunPodProvider(Provider):
     def list_resources(self, filters: dict = None) -> List[Resource]:
         resources = []
         filters = filters or {}
+        running_only = bool(filters.get("running"))
 
         try:
-            # GraphQL query for pods
-            query = """
-            query {
-                myself {
-                    pods {
-                        id
-                        name
-                        desiredStatus
-                        runtime {
-                            gpuCount
-                        }
-                        machine {
-                            gpuDisplayName
-                        }
-                    }
-                }
-            }
-            """
+            # Everything is fetched in one GraphQL round trip
             response = self.session.post(
                 "https://api.runpod.io/graphql",
-                json={"query": query}
+                json={"query": RUNPOD_QUERY},
+                headers=self.headers,
+                timeout=HTTP_TIMEOUT
             )
             if response.ok:
-                data = response.json()
-                pods = data.get("data", {}).get("myself", {}).get("pods", [])
+                data = _loads(response.content)
+                myself = (data.get("data") or {}).get("myself") or {}
 
-                for pod in pods:
-                    status = pod.get("desiredStatus", "unknown").lower()
+                for pod in myself.get("pods") or []:
+                    status = sys.intern((pod.get("desiredStatus") or "unknown").lower())
 
-                    if filters.get("running") and status != "running":
+                    if running_only and status != "running":
                         continue
 
                     resources.append(Resource(
@@ -398,8 +588,27 @@ class RunPodProvider(Provider):
                         status=status,
                         region="global",
                         provider=self.name,
-                        gpu_name=pod.get("machine", {}).get("gpuDisplayName"),
-                        num_gpus=pod.get("runtime", {}).get("gpuCount")
+                        gpu_name=(pod.get("machine") or {}).get("gpuDisplayName"),
+                        num_gpus=(pod.get("runtime") or {}).get("gpuCount")
+                    ))
+
+                for endpoint in myself.get("endpoints") or []:
+                    resources.append(Resource(
+                        name=endpoint.get("name") or f"endpoint-{endpoint.get('id')}",
+                        resource_type="serverless",
+                        status="active",
+                        region="global",
+                        provider=self.name
+                    ))
+
+                for volume in myself.get("networkVolumes") or []:
+                    resources.append(Resource(
+                        name=volume.get("name") or f"volume-{volume.get('id')}",
+                        resource_type="volume",
+                        status="active",
+                        region=volume.get("dataCenterId") or "unknown",
+                        provider=self.name,
+                        size_gb=volume.get("size")
                     ))
 
         except Exception as e:
@@ -408,6 +617,18 @@ class RunPodProvider(Provider):
         return resources
 
 
+# Available providers, keyed by CLI flag / config name. Only the selected
+# ones are instantiated, and each imports its SDK or HTTP client in
+# initialize(), so unused providers cost nothing at startup.
+PROVIDERS = {
+    "oracle": OracleProvider,
+    "cloudflare": CloudflareProvider,
+    "neon": NeonProvider,
+    "vastai": VastAIProvider,
+    "runpod": RunPodProvider,
+}
+
+
 def load_config() -> dict:
     """Load configuration from centralized config or legacy file."""
     # Try centralized config first
@@ -444,8 +665,7 @@ def load_config() -> dict:
 
     # Fall back to legacy config
     if LEGACY_CONFIG_PATH.exists():
-        with open(LEGACY_CONFIG_PATH) as f:
-            return json.load(f)
+        return _loads(LEGACY_CONFIG_PATH.read_bytes())
     return {}
 
 
@@ -476,11 +696,22 @@ def save_sample_config():
             }
         }
         with open(LEGACY_CONFIG_PATH, "w") as f:
-            json.dump(sample, f, indent=2)
+            f.write(_dumps(sample))
         speak_plain(f"Legacy config created: {LEGACY_CONFIG_PATH}")
         speak_plain("Note: Consider using adsops_config.py for centralized config")
 
 
+# Table row layouts; the DETAILS column is only shown with --wide. Each
+# column's precision truncates overlong values so rows stay aligned.
+ROW_NARROW = "{name:<30.30} {type:<15.15} {region:<15.15} {status:<10.10}"
+ROW_WIDE = ROW_NARROW + " {details}"
+
+# Provider header bar and the rules under the column headings
+HEADER_BAR = "=" * 60
+SEPARATOR_NARROW = "-" * 70
+SEPARATOR_WIDE = "-" * 90
+
+
 def format_table(resources: List[Resource], wide: bool = False):
     """Format resources as a table."""
     if not resources:
@@ -488,23 +719,22 @@ def format_table(resources: List[Resource], wide: bool = False):
         return
 
     # Group by provider
-    by_provider: Dict[str, List[Resource]] = {}
+    by_provider: Dict[str, List[Resource]] = defaultdict(list)
     for r in resources:
-        if r.provider not in by_provider:
-            by_provider[r.provider] = []
         by_provider[r.provider].append(r)
 
+    row = (ROW_WIDE if wide else ROW_NARROW).format
+    separator = SEPARATOR_WIDE if wide else SEPARATOR_NARROW
+    header = row(name="NAME", type="TYPE", region="REGION", status="STATUS", details="DETAILS")
+    lines = []
+
     for provider, provider_resources in by_provider.items():
-        speak_plain("")
-        speak_plain(f"=== {provider.upper()} " + "=" * (60 - len(provider)))
-        speak_plain("")
+        lines.append("")
+        lines.append(f"=== {provider.upper()} {HEADER_BAR[:max(0, 60 - len(provider))]}")
+        lines.append("")
 
-        if wide:
-            speak_plain(f"{'NAME':<30} {'TYPE':<15} {'REGION':<15} {'STATUS':<10} {'DETAILS'}")
-            speak_plain("-" * 90)
-        else:
-            speak_plain(f"{'NAME':<30} {'TYPE':<15} {'REGION':<15} {'STATUS':<10}")
-            speak_plain("-" * 70)
+        lines.append(header)
+        lines.append(separator)
 
         for r in provider_resources:
             details = ""
@@ -515,17 +745,46 @@ def format_table(resources: List[Resource], wide: bool = False):
                     details = f"gpu={r.extra['gpu_name']}"
                 if r.extra.get("pg_version"):
                     details = f"pg={r.extra['pg_version']}"
+                if r.extra.get("size_gb"):
+                    details = f"size={r.extra['size_gb']}GB"
 
-            name = r.name[:28] + ".." if len(r.name) > 30 else r.name
-            region = r.region[:13] + ".." if len(r.region) > 15 else r.region
+            # Mark truncated names and regions so it's clear they're cut short
+            name = r.name if len(r.name) <= 30 else r.name[:28] + ".."
+            region = r.region if len(r.region) <= 15 else r.region[:13] + ".."
 
-            if wide:
-                speak_plain(f"{name:<30} {r.type:<15} {region:<15} {r.status:<10} {details}")
-            else:
-                speak_plain(f"{name:<30} {r.type:<15} {region:<15} {r.status:<10}")
+            lines.append(row(name=name, type=r.type, region=region, status=r.status, details=details))
+
+    lines.append("")
+    lines.append(f"Total: {len(resources)} resources")
+    write_lines(lines)
+
+
+def snapshot(resources: List[Resource]) -> dict:
+    """Map each resource to its displayed state, for --changes diffs."""
+    return {(r.provider, r.type, r.name): (r.status, r.region) for r in resources}
 
-    speak_plain("")
-    speak_plain(f"Total: {len(resources)} resources")
+
+def format_changes(previous: dict, current: dict):
+    """Print only resources that appeared, changed or disappeared."""
+    lines = [""]
+
+    for key, (status, region) in current.items():
+        provider, rtype, name = key
+        old = previous.get(key)
+        if old is None:
+            lines.append(f"NEW: {provider} {rtype} {name} - {status}, {region}")
+        elif old != (status, region):
+            lines.append(f"CHANGED: {provider} {rtype} {name} - {old[0]} -> {status}, {region}")
+
+    for provider, rtype, name in previous.keys() - current.keys():
+        lines.append(f"GONE: {provider} {rtype} {name}")
+
+    changes = len(lines) - 1
+    if not changes:
+        lines.append("No changes.")
+    lines.append("")
+    lines.append(f"Total: {len(current)} resources, {changes} changed")
+    write_lines(lines)
 
 
 def format_json(resources: List[Resource]):
@@ -535,36 +794,22 @@ def format_json(resources: List[Resource]):
         "total": len(resources),
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
-    print(json.dumps(output, indent=2))
-
-
-def run_collection(args, config: dict):
-    """Run resource collection."""
-    providers_to_use = []
+    if orjson is not None:
+        # orjson already produces UTF-8 bytes; skip the text layer
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(_dumps(output))
 
-    # Available providers
-    all_providers = {
-        "oracle": OracleProvider,
-        "cloudflare": CloudflareProvider,
-        "neon": NeonProvider,
-        "vastai": VastAIProvider,
-        "runpod": RunPodProvider,
-    }
 
+def init_providers(args, config: dict) -> List[Provider]:
+    """Select and initialize the providers to collect from."""
     # Determine which providers to use
     if args.all:
-        providers_to_use = list(all_providers.keys())
+        providers_to_use = list(PROVIDERS)
     else:
-        if args.oracle:
-            providers_to_use.append("oracle")
-        if args.cloudflare:
-            providers_to_use.append("cloudflare")
-        if args.neon:
-            providers_to_use.append("neon")
-        if args.vastai:
-            providers_to_use.append("vastai")
-        if args.runpod:
-            providers_to_use.append("runpod")
+        providers_to_use = [name for name in PROVIDERS if getattr(args, name)]
 
     # Default to all enabled providers if none specified
     if not providers_to_use:
@@ -582,44 +827,57 @@ def run_collection(args, config: dict):
     provider_configs = config.get("providers", {})
 
     for name in providers_to_use:
-        if name not in all_providers:
+        if name not in PROVIDERS:
             continue
 
         pconfig = provider_configs.get(name, {})
-        provider = all_providers[name]()
+        provider = PROVIDERS[name]()
 
         if provider.initialize(pconfig):
             active_providers.append(provider)
 
     if not active_providers:
         speak_plain("No providers could be initialized.")
+
+    return active_providers
+
+
+def completed_results(futures: dict):
+    """Yield each provider's resources as it finishes, reporting failures."""
+    for future in as_completed(futures):
+        try:
+            yield future.result()
+        except Exception as e:
+            provider = futures[future]
+            speak(f"Error from {provider.name}: {e}")
+
+
+def run_collection(args, active_providers: List[Provider],
+                   cache: Optional[SWRCache] = None) -> List[Resource]:
+    """Run resource collection, through cache when given (--refresh mode)."""
+    if not active_providers:
         return []
 
     # Collect resources
     filters = {"running": args.running}
-    all_resources = []
 
     speak(f"Collecting from {len(active_providers)} providers...")
 
-    with ThreadPoolExecutor(max_workers=len(active_providers)) as executor:
+    executor = get_executor()
+    if cache is not None:
+        futures = {
+            executor.submit(
+                cache.get, (p.name, args.running), partial(p.list_resources, filters), args.refresh
+            ): p
+            for p in active_providers
+        }
+    else:
         futures = {
             executor.submit(p.list_resources, filters): p
             for p in active_providers
         }
 
-        for future in as_completed(futures):
-            try:
-                resources = future.result()
-                all_resources.extend(resources)
-            except Exception as e:
-                provider = futures[future]
-                speak(f"Error from {provider.name}: {e}")
-
-    # Cleanup
-    for p in active_providers:
-        p.close()
-
-    return all_resources
+    return list(chain.from_iterable(completed_results(futures)))
 
 
 def main():
@@ -636,6 +894,7 @@ Examples:
     cloudtop.py --json                   # JSON output
     cloudtop.py --wide                   # Wide table with details
     cloudtop.py --refresh 30             # Auto-refresh every 30s
+    cloudtop.py --refresh 30 --changes   # Only report what changed
     cloudtop.py init                     # Generate config file
 
 Environment Variables:
@@ -648,6 +907,7 @@ Screen Reader Notes:
     Resources are grouped by provider.
     Each resource shows name, type, region, and status.
     Use --wide for additional details.
+    Use --refresh with --changes to hear only what changed each tick.
 """
     )
 
@@ -666,6 +926,8 @@ Screen Reader Notes:
     parser.add_argument("--json", "-j", action="store_true", help="JSON output")
     parser.add_argument("--wide", "-w", action="store_true", help="Wide table")
     parser.add_argument("--refresh", type=int, metavar="SECONDS", help="Auto-refresh")
+    parser.add_argument("--changes", action="store_true",
+                        help="With --refresh, show only resources that changed")
 
     # Commands
     parser.add_argument("command", nargs="?", help="Command (init)")
@@ -679,26 +941,41 @@ Screen Reader Notes:
 
     # Load config
     config = load_config()
+    active_providers = []
 
     try:
+        # Providers are set up once, even across refresh ticks
+        active_providers = init_providers(args, config)
+
         if args.refresh:
-            # Continuous mode
+            # Continuous mode; listings are served from cache and refreshed
+            # in the background
+            cache = SWRCache(get_executor())
+            previous = None
+            tick = 0
+
             while True:
                 # Clear screen (accessible way)
                 speak_plain("\n" * 3)
                 speak(f"cloudtop - refreshing every {args.refresh}s (Ctrl+C to quit)")
 
-                resources = run_collection(args, config)
+                resources = run_collection(args, active_providers, cache)
 
                 if args.json:
                     format_json(resources)
+                elif args.changes and previous is not None and tick % FULL_TABLE_EVERY:
+                    format_changes(previous, snapshot(resources))
                 else:
                     format_table(resources, args.wide)
 
+                if args.changes:
+                    previous = snapshot(resources)
+                tick += 1
+
                 time.sleep(args.refresh)
         else:
             # Single run
-            resources = run_collection(args, config)
+            resources = run_collection(args, active_providers)
 
             if args.json:
                 format_json(resources)
@@ -709,6 +986,9 @@ Screen Reader Notes:
         speak("")
         speak("Goodbye!")
         sys.exit(0)
+    finally:
+        for p in active_providers:
+            p.close()
 
 
 if __name__ == "__main__":
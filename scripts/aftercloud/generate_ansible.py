@@ -13,10 +13,18 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
+import re
 import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Optional
 
 try:
     import oci
@@ -32,6 +40,23 @@ except ImportError:
     print("Install with: pip install pyyaml")
     sys.exit(1)
 
+# libyaml's C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+
+# Concurrent per-instance IP lookups
+LOOKUP_WORKERS = 16
+
+# Ampere A1 shapes, grouped as Ubuntu hosts in the inventory
+ARM_SHAPE_PREFIXES = ("VM.Standard.A1.", "BM.Standard.A1.")
+
+# Instance and IP lookups are reused by repeat runs within this window
+CACHE_DIR = Path.home() / ".cache" / "adsops-generate-ansible"
+CACHE_TTL_SECONDS = 60
+
 
 def speak(message: str):
     """Print message with timestamp for screen readers."""
@@ -41,11 +66,16 @@ def speak(message: str):
 
 
 def speak_plain(message: str):
-    """Print without timestamp."""
+    """Print without timestamp (flushed by the next status line or at exit)."""
     print(message)
-    sys.stdout.flush()
 
 
+def dump_yaml(data, stream=None):
+    """Write data as block-style YAML, keeping key order (returned if no stream)."""
+    return yaml.dump(data, stream, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+@lru_cache(maxsize=4)
 def get_oci_config(profile: str = "DEFAULT") -> dict:
     """Load OCI SDK configuration."""
     config_path = Path.home() / ".oci" / "config"
@@ -56,32 +86,58 @@ def get_oci_config(profile: str = "DEFAULT") -> dict:
     return oci.config.from_file(profile_name=profile)
 
 
+def share_session(*clients):
+    """
+    Make all clients use the first one's HTTP session.
+
+    Compute and networking share the regional iaas endpoint, so keep-alive
+    connections are reused across both, and the pool is sized for the
+    concurrent IP lookups.
+    """
+    session = clients[0].base_client.session
+    # Same adapter class the SDK mounted (it vendors requests)
+    adapter_class = type(session.get_adapter("https://"))
+    session.mount("https://", adapter_class(
+        pool_connections=LOOKUP_WORKERS,
+        pool_maxsize=LOOKUP_WORKERS
+    ))
+    for client in clients[1:]:
+        client.base_client.session = session
+
+
+# Runs of anything but letters and digits, underscores included, so that
+# each run collapses to a single underscore
+_NON_IDENTIFIER_RE = re.compile(r"[\W_]+")
+
+# Lowercases letters and maps everything else but digits to "_" in one pass
+_ASCII_IDENTIFIER_TABLE = bytes(
+    ord(chr(c).lower()) if chr(c).isalnum() else ord("_") for c in range(128)
+) + b"_" * 128
+
+
 def sanitize_name(name: str) -> str:
     """Convert name to valid Ansible identifier."""
-    result = ""
-    for char in name.lower():
-        if char.isalnum() or char == "_":
-            result += char
-        else:
-            result += "_"
-    while "__" in result:
-        result = result.replace("__", "_")
-    return result.strip("_")
+    if name.isascii():
+        # Dropping empty pieces collapses runs of "_" and strips the ends
+        pieces = name.encode("ascii").translate(_ASCII_IDENTIFIER_TABLE).split(b"_")
+        return b"_".join(filter(None, pieces)).decode("ascii")
+    return _NON_IDENTIFIER_RE.sub("_", name.lower()).strip("_")
 
 
-def get_instance_ip(compute_client, network_client, instance) -> dict:
-    """Get IP addresses for an instance."""
+@lru_cache(maxsize=4096)
+def get_vnic(network_client, vnic_id: str):
+    """Fetch a VNIC once per process; failed lookups are not cached."""
+    return network_client.get_vnic(vnic_id).data
+
+
+def get_instance_ip(network_client, vnic_attachments: list) -> dict:
+    """Get IP addresses for an instance from its VNIC attachments."""
     ips = {"private": None, "public": None}
 
     try:
-        vnics = compute_client.list_vnic_attachments(
-            compartment_id=instance.compartment_id,
-            instance_id=instance.id
-        ).data
-
-        for vnic_att in vnics:
+        for vnic_att in vnic_attachments:
             if vnic_att.lifecycle_state == "ATTACHED":
-                vnic = network_client.get_vnic(vnic_att.vnic_id).data
+                vnic = get_vnic(network_client, vnic_att.vnic_id)
                 ips["private"] = vnic.private_ip
                 ips["public"] = vnic.public_ip
                 break
@@ -91,12 +147,97 @@ def get_instance_ip(compute_client, network_client, instance) -> dict:
     return ips
 
 
-def generate_inventory(compute_client, network_client, compartment_id: str) -> dict:
-    """Generate Ansible inventory from OCI instances."""
+def host_cache_file(oci_config: dict, compartment_id: str) -> Path:
+    """
+    Cache file for one tenancy, region and compartment.
+
+    Instances are regional and the default compartment is the tenancy, which
+    is the same in every region, so the compartment alone is not a safe key.
+    """
+    key = "|".join((oci_config.get("tenancy", ""), oci_config.get("region", ""), compartment_id))
+    return CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+
+
+def load_cached_hosts(cache_file: Path) -> Optional[list]:
+    """Return host records cached by a recent run, if still fresh."""
+    try:
+        age = time.time() - cache_file.stat().st_mtime
+        if age < CACHE_TTL_SECONDS:
+            speak(f"  Using instance data cached {int(age)}s ago (--refresh-cache to refetch)")
+            return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_cached_hosts(cache_file: Path, hosts: list):
+    """Cache host records for repeat runs; failures are not fatal."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent run never reads a partial file
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(hosts))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def fetch_hosts(compute_client, network_client, compartment_id: str) -> list:
+    """Fetch running instances and their IPs as plain host records."""
+    running_instances = oci.pagination.list_call_get_all_results(
+        compute_client.list_instances,
+        compartment_id=compartment_id,
+        lifecycle_state="RUNNING"
+    ).data
+
+    # One listing for the whole compartment instead of one per instance
+    attachments_by_instance = defaultdict(list)
+    for vnic_att in oci.pagination.list_call_get_all_results(
+        compute_client.list_vnic_attachments,
+        compartment_id=compartment_id
+    ).data:
+        attachments_by_instance[vnic_att.instance_id].append(vnic_att)
+
+    # Look up IPs concurrently; records are assembled in order below
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        instance_ips = list(executor.map(
+            partial(get_instance_ip, network_client),
+            [attachments_by_instance[i.id] for i in running_instances]
+        ))
+
+    hosts = []
+    for instance, ips in zip(running_instances, instance_ips):
+        host_vars = {
+            # Prefer public IP, fall back to private
+            "ansible_host": ips["public"] or ips["private"],
+            "oci_instance_id": instance.id,
+            "oci_shape": instance.shape,
+            "oci_availability_domain": instance.availability_domain,
+            "private_ip": ips["private"],
+            "public_ip": ips["public"]
+        }
+
+        if instance.shape_config:
+            host_vars["oci_ocpus"] = instance.shape_config.ocpus
+            host_vars["oci_memory_gb"] = instance.shape_config.memory_in_gbs
+
+        hosts.append({"display_name": instance.display_name, "host_vars": host_vars})
+
+    return hosts
+
+
+def generate_inventory(compute_client, network_client, compartment_id: str,
+                       cache_file: Optional[Path] = None, refresh_cache: bool = False) -> dict:
+    """Generate Ansible inventory from OCI instances (cached in cache_file if given)."""
     speak("Generating Ansible inventory...")
 
-    instances = compute_client.list_instances(compartment_id=compartment_id).data
-    running_instances = [i for i in instances if i.lifecycle_state == "RUNNING"]
+    hosts = None
+    if cache_file is not None and not refresh_cache:
+        hosts = load_cached_hosts(cache_file)
+    if hosts is None:
+        hosts = fetch_hosts(compute_client, network_client, compartment_id)
+        if cache_file is not None:
+            save_cached_hosts(cache_file, hosts)
 
     inventory = {
         "all": {
@@ -120,44 +261,36 @@ def generate_inventory(compute_client, network_client, compartment_id: str) -> d
         }
     }
 
-    for instance in running_instances:
-        name = sanitize_name(instance.display_name)
-        ips = get_instance_ip(compute_client, network_client, instance)
+    all_hosts = inventory["all"]["hosts"]
+    groups = inventory["all"]["children"]
+    oci_hosts = groups["oci_instances"]["hosts"]
+    oracle_linux_hosts = groups["oracle_linux"]["hosts"]
+    ubuntu_hosts = groups["ubuntu"]["hosts"]
 
-        # Prefer public IP, fall back to private
-        ansible_host = ips["public"] or ips["private"]
+    for host in hosts:
+        name = sanitize_name(host["display_name"])
+        host_vars = host["host_vars"]
+
+        ansible_host = host_vars["ansible_host"]
         if not ansible_host:
-            speak(f"  Skipping {instance.display_name}: no IP address found")
+            speak(f"  Skipping {host['display_name']}: no IP address found")
             continue
 
-        host_vars = {
-            "ansible_host": ansible_host,
-            "oci_instance_id": instance.id,
-            "oci_shape": instance.shape,
-            "oci_availability_domain": instance.availability_domain,
-            "private_ip": ips["private"],
-            "public_ip": ips["public"]
-        }
-
-        if instance.shape_config:
-            host_vars["oci_ocpus"] = instance.shape_config.ocpus
-            host_vars["oci_memory_gb"] = instance.shape_config.memory_in_gbs
-
         # Add to all hosts
-        inventory["all"]["hosts"][name] = host_vars
-        inventory["all"]["children"]["oci_instances"]["hosts"][name] = {}
+        all_hosts[name] = host_vars
+        oci_hosts[name] = {}
 
         # Categorize by OS (based on shape - ARM typically Ubuntu, x86 typically Oracle Linux)
-        if "A1" in instance.shape:
-            inventory["all"]["children"]["ubuntu"]["hosts"][name] = {
+        if host_vars["oci_shape"].startswith(ARM_SHAPE_PREFIXES):
+            ubuntu_hosts[name] = {
                 "ansible_user": "ubuntu"
             }
         else:
-            inventory["all"]["children"]["oracle_linux"]["hosts"][name] = {}
+            oracle_linux_hosts[name] = {}
 
         speak(f"  Added host: {name} ({ansible_host})")
 
-    speak(f"  Total hosts: {len(inventory['all']['hosts'])}")
+    speak(f"  Total hosts: {len(all_hosts)}")
     return inventory
 
 
@@ -373,6 +506,21 @@ def generate_docker_playbook() -> dict:
     }
 
 
+# Bundled playbooks, in site.yml order. They don't depend on the
+# compartment, so each is rendered to YAML at most once per process.
+PLAYBOOKS = {
+    "provision": generate_provision_playbook,
+    "security": generate_security_playbook,
+    "docker": generate_docker_playbook,
+}
+
+
+@lru_cache(maxsize=None)
+def render_playbook(name: str) -> str:
+    """Render a bundled playbook to YAML."""
+    return dump_yaml([PLAYBOOKS[name]()])
+
+
 def generate_oci_collection_requirements() -> dict:
     """Generate Ansible Galaxy requirements for OCI collection."""
     return {
@@ -400,100 +548,108 @@ pipelining = True
 """
 
 
+def read_compartments(path: str) -> list:
+    """Read compartment OCIDs from a file, one per line ('#' starts a comment)."""
+    compartments = []
+    for line in Path(path).expanduser().read_text().splitlines():
+        ocid = line.split("#", 1)[0].strip()
+        if ocid and ocid not in compartments:
+            compartments.append(ocid)
+    return compartments
+
+
+def render_export(args, oci_config, compute_client, network_client,
+                  compartment_id, output_path):
+    """Render every export file for one compartment as (path, content) pairs."""
+    outputs = []
+
+    # Generate inventory
+    if args.inventory or args.all or not args.playbooks:
+        inventory = generate_inventory(
+            compute_client, network_client, compartment_id,
+            cache_file=None if args.no_cache else host_cache_file(oci_config, compartment_id),
+            refresh_cache=args.refresh_cache
+        )
+        outputs.append((output_path / "inventory.yml", dump_yaml(inventory)))
+
+    # Generate playbooks
+    if args.playbooks or args.all or not args.inventory:
+        # Provision, security and Docker playbooks
+        for name in PLAYBOOKS:
+            outputs.append((output_path / "playbooks" / f"{name}.yml", render_playbook(name)))
+
+        # Site playbook (imports all others)
+        site = [{"import_playbook": f"playbooks/{name}.yml"} for name in PLAYBOOKS]
+        outputs.append((output_path / "site.yml", dump_yaml(site)))
+
+    # Generate requirements.yml
+    requirements = generate_oci_collection_requirements()
+    outputs.append((output_path / "requirements.yml", dump_yaml(requirements)))
+
+    # Generate ansible.cfg
+    outputs.append((output_path / "ansible.cfg", generate_ansible_cfg()))
+
+    # Generate group_vars/all.yml
+    group_vars = {
+        "oci_compartment_id": compartment_id,
+        "oci_region": oci_config.get("region", "us-ashburn-1"),
+        "oci_tenancy_id": oci_config.get("tenancy", "")
+    }
+    outputs.append((output_path / "group_vars" / "all.yml", dump_yaml(group_vars)))
+
+    return outputs
+
+
 def run_export(args):
     """Run the Ansible export."""
     speak("Oracle Cloud to Ansible Export")
     speak("")
 
     oci_config = get_oci_config(args.profile)
-    compartment_id = args.compartment or oci_config["tenancy"]
-
-    speak(f"Compartment: {compartment_id}")
-    speak(f"Output directory: {args.output}")
-    speak("")
-
-    # Create output directory structure
-    output_path = Path(args.output).expanduser()
-    output_path.mkdir(parents=True, exist_ok=True)
-    (output_path / "playbooks").mkdir(exist_ok=True)
-    (output_path / "group_vars").mkdir(exist_ok=True)
-    (output_path / "host_vars").mkdir(exist_ok=True)
+    output_root = Path(args.output).expanduser()
+
+    # With --compartments-file each compartment gets its own subdirectory,
+    # named by OCID, and the config and clients are reused across all of them
+    if args.compartments_file:
+        targets = [(compartment_id, output_root / compartment_id)
+                   for compartment_id in read_compartments(args.compartments_file)]
+        if not targets:
+            print(f"Error: No compartments found in {args.compartments_file}")
+            sys.exit(1)
+    else:
+        targets = [(args.compartment or oci_config["tenancy"], output_root)]
 
     # Initialize clients
     compute_client = oci.core.ComputeClient(oci_config)
     network_client = oci.core.VirtualNetworkClient(oci_config)
+    share_session(compute_client, network_client)
 
-    try:
-        # Generate inventory
-        if args.inventory or args.all or not args.playbooks:
-            inventory = generate_inventory(compute_client, network_client, compartment_id)
-
-            inventory_file = output_path / "inventory.yml"
-            with open(inventory_file, "w") as f:
-                yaml.dump(inventory, f, default_flow_style=False, sort_keys=False)
-            speak(f"Written: {inventory_file}")
-
-        # Generate playbooks
-        if args.playbooks or args.all or not args.inventory:
-            # Provision playbook
-            provision = generate_provision_playbook()
-            provision_file = output_path / "playbooks" / "provision.yml"
-            with open(provision_file, "w") as f:
-                yaml.dump([provision], f, default_flow_style=False, sort_keys=False)
-            speak(f"Written: {provision_file}")
-
-            # Security playbook
-            security = generate_security_playbook()
-            security_file = output_path / "playbooks" / "security.yml"
-            with open(security_file, "w") as f:
-                yaml.dump([security], f, default_flow_style=False, sort_keys=False)
-            speak(f"Written: {security_file}")
-
-            # Docker playbook
-            docker = generate_docker_playbook()
-            docker_file = output_path / "playbooks" / "docker.yml"
-            with open(docker_file, "w") as f:
-                yaml.dump([docker], f, default_flow_style=False, sort_keys=False)
-            speak(f"Written: {docker_file}")
-
-            # Site playbook (imports all others)
-            site = [
-                {"import_playbook": "playbooks/provision.yml"},
-                {"import_playbook": "playbooks/security.yml"},
-                {"import_playbook": "playbooks/docker.yml"}
-            ]
-            site_file = output_path / "site.yml"
-            with open(site_file, "w") as f:
-                yaml.dump(site, f, default_flow_style=False, sort_keys=False)
-            speak(f"Written: {site_file}")
-
-        # Generate requirements.yml
-        requirements = generate_oci_collection_requirements()
-        req_file = output_path / "requirements.yml"
-        with open(req_file, "w") as f:
-            yaml.dump(requirements, f, default_flow_style=False, sort_keys=False)
-        speak(f"Written: {req_file}")
-
-        # Generate ansible.cfg
-        cfg_file = output_path / "ansible.cfg"
-        with open(cfg_file, "w") as f:
-            f.write(generate_ansible_cfg())
-        speak(f"Written: {cfg_file}")
-
-        # Generate group_vars/all.yml
-        group_vars = {
-            "oci_compartment_id": compartment_id,
-            "oci_region": oci_config.get("region", "us-ashburn-1"),
-            "oci_tenancy_id": oci_config.get("tenancy", "")
-        }
-        group_vars_file = output_path / "group_vars" / "all.yml"
-        with open(group_vars_file, "w") as f:
-            yaml.dump(group_vars, f, default_flow_style=False, sort_keys=False)
-        speak(f"Written: {group_vars_file}")
+    for compartment_id, output_path in targets:
+        speak(f"Compartment: {compartment_id}")
+        speak(f"Output directory: {output_path}")
+        speak("")
 
-    except oci.exceptions.ServiceError as e:
-        print(f"Error: {e.message}")
-        sys.exit(1)
+        # Create output directory structure
+        output_path.mkdir(parents=True, exist_ok=True)
+        (output_path / "playbooks").mkdir(exist_ok=True)
+        (output_path / "group_vars").mkdir(exist_ok=True)
+        (output_path / "host_vars").mkdir(exist_ok=True)
+
+        # Everything is rendered before anything is written, so an API error
+        # part way through can't leave a half-updated tree behind
+        try:
+            outputs = render_export(args, oci_config, compute_client, network_client,
+                                    compartment_id, output_path)
+        except oci.exceptions.ServiceError as e:
+            print(f"Error: {e.message}")
+            sys.exit(1)
+
+        for output_file, content in outputs:
+            output_file.write_text(content)
+            speak(f"Written: {output_file}")
+
+        if len(targets) > 1:
+            speak("")
 
     speak("")
     speak("Export complete!")
@@ -523,6 +679,8 @@ Examples:
     generate_ansible.py --inventory --output ./ansible
     generate_ansible.py --playbooks --output ./ansible
     generate_ansible.py --all --output ./ansible
+    generate_ansible.py --refresh-cache         # Ignore cached instance data
+    generate_ansible.py --compartments-file compartments.txt --output ./ansible
 
 Screen Reader Notes:
     Progress messages include timestamps.
@@ -539,6 +697,11 @@ Screen Reader Notes:
         "--compartment", "-c",
         help="Compartment OCID (default: tenancy root)"
     )
+    parser.add_argument(
+        "--compartments-file",
+        metavar="FILE",
+        help="File of compartment OCIDs, one per line; each is exported to OUTPUT/<ocid>"
+    )
     parser.add_argument(
         "--output", "-o",
         default="./ansible",
@@ -559,6 +722,16 @@ Screen Reader Notes:
         action="store_true",
         help="Generate everything"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't read or write the {CACHE_TTL_SECONDS}s instance lookup cache"
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Refetch instance data even if a fresh cache exists"
+    )
 
     args = parser.parse_args()
 
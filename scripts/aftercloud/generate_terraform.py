@@ -15,9 +15,15 @@ Usage:
 import argparse
 import json
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
 
 try:
     import oci
@@ -27,19 +33,55 @@ except ImportError:
     sys.exit(1)
 
 
+# SDK client for each resource type, in output order
+RESOURCE_CLIENTS = {
+    "network": oci.core.VirtualNetworkClient,
+    "compute": oci.core.ComputeClient,
+    "storage": oci.core.BlockstorageClient,
+    "objectstorage": oci.object_storage.ObjectStorageClient,
+    "loadbalancer": oci.load_balancer.LoadBalancerClient,
+}
+
+# Exporters hit separate services, so they run side by side
+EXPORT_WORKERS = 8
+# Per-VCN and per-availability-domain list calls made concurrently within an exporter
+LOOKUP_WORKERS = 16
+# Network and compute lookups can hit the iaas endpoint at the same time
+HTTP_POOL_SIZE = 2 * LOOKUP_WORKERS
+
+# The Object Storage namespace is fixed per tenancy, so it is cached for a day
+CACHE_DIR = Path.home() / ".cache" / "adsops-generate-terraform"
+NAMESPACE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Retry policy for every SDK call. An export only reads, so it can afford to
+# ride out throttling (429) and transient 5xx rather than abort the whole run
+RETRY_MAX_ATTEMPTS = 5
+RETRY_MAX_WAIT_SECONDS = 30
+
+# Resource files are written through one large buffer rather than joined in memory first
+WRITE_BUFFER_BYTES = 1 << 20
+
+# First lines of every resource file, also used to recognise files we wrote
+GENERATED_HEADER = "# Oracle Cloud Infrastructure Resources\n# Generated by generate_terraform.py"
+
+# Keeps progress lines from concurrent exporters from interleaving
+_speak_lock = threading.Lock()
+
+
 def speak(message: str):
     """Print message with timestamp for screen readers."""
     timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {message}")
-    sys.stdout.flush()
+    with _speak_lock:
+        print(f"[{timestamp}] {message}")
+        sys.stdout.flush()
 
 
 def speak_plain(message: str):
-    """Print without timestamp."""
+    """Print without timestamp (flushed by the next status line or at exit)."""
     print(message)
-    sys.stdout.flush()
 
 
+@lru_cache(maxsize=4)
 def get_oci_config(profile: str = "DEFAULT") -> dict:
     """Load OCI SDK configuration."""
     config_path = Path.home() / ".oci" / "config"
@@ -50,23 +92,138 @@ def get_oci_config(profile: str = "DEFAULT") -> dict:
     return oci.config.from_file(profile_name=profile)
 
 
+@lru_cache(maxsize=1)
+def get_retry_strategy():
+    """Build the shared SDK retry strategy."""
+    return oci.retry.RetryStrategyBuilder(
+        max_attempts_check=True,
+        max_attempts=RETRY_MAX_ATTEMPTS,
+        total_elapsed_time_check=True,
+        retry_max_wait_between_calls_seconds=RETRY_MAX_WAIT_SECONDS,
+        service_error_check=True,
+        service_error_retry_on_any_5xx=True,
+        service_error_retry_config={429: []}
+    ).get_retry_strategy()
+
+
+def share_session(*clients):
+    """
+    Make all clients use the first one's HTTP session.
+
+    Compute, networking, block storage and load balancing share the regional
+    iaas endpoint, so keep-alive connections are reused across all of them,
+    and the pool is sized for the concurrent lookups inside the exporters.
+    """
+    session = clients[0].base_client.session
+    # Same adapter class the SDK mounted (it vendors requests)
+    adapter_class = type(session.get_adapter("https://"))
+    session.mount("https://", adapter_class(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE
+    ))
+    for client in clients[1:]:
+        client.base_client.session = session
+
+
+def load_cached_namespace(tenancy_id: str) -> Optional[str]:
+    """Return the namespace cached for a tenancy, if still fresh."""
+    cache_file = CACHE_DIR / f"namespace-{tenancy_id}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < NAMESPACE_CACHE_TTL_SECONDS:
+            return json.loads(cache_file.read_text()) or None
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_cached_namespace(tenancy_id: str, namespace: str):
+    """Cache a tenancy's namespace for later runs; failures are not fatal."""
+    cache_file = CACHE_DIR / f"namespace-{tenancy_id}.json"
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent run never reads a partial file
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(namespace))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def get_namespace(object_storage_client, tenancy_id: str, use_cache: bool = True) -> str:
+    """Get the Object Storage namespace, from the cache when possible."""
+    namespace = load_cached_namespace(tenancy_id) if use_cache else None
+    if namespace is None:
+        namespace = object_storage_client.get_namespace().data
+        if use_cache:
+            save_cached_namespace(tenancy_id, namespace)
+    return namespace
+
+
+_NON_IDENTIFIER_RE = re.compile(r"[\W_]+")
+
+# Lowercases letters and maps everything else but digits to "_" in one pass
+_ASCII_IDENTIFIER_TABLE = bytes(
+    ord(chr(c).lower()) if chr(c).isalnum() else ord("_") for c in range(128)
+) + b"_" * 128
+
+
 def sanitize_name(name: str) -> str:
     """Convert name to valid Terraform resource name."""
-    # Replace invalid characters with underscores
-    result = ""
-    for char in name.lower():
-        if char.isalnum() or char == "_":
-            result += char
-        else:
-            result += "_"
-    # Remove consecutive underscores
-    while "__" in result:
-        result = result.replace("__", "_")
-    # Remove leading/trailing underscores
-    return result.strip("_")
-
-
-def generate_provider_block(config: dict) -> str:
+    if name.isascii():
+        # Dropping empty pieces collapses runs of "_" and strips the ends
+        pieces = name.encode("ascii").translate(_ASCII_IDENTIFIER_TABLE).split(b"_")
+        return b"_".join(filter(None, pieces)).decode("ascii")
+    return _NON_IDENTIFIER_RE.sub("_", name.lower()).strip("_")
+
+
+# Bound once so the render loops skip json.dumps' per-call argument handling
+_encode_json = json.JSONEncoder().encode
+
+
+def hcl_map(tags: Optional[dict]) -> str:
+    """Render a tag dict as an HCL map literal ("{}" when empty or missing)."""
+    return _encode_json(tags) if tags else "{}"
+
+
+def unique_names(names) -> list:
+    """
+    Sanitize a batch of names into Terraform names, unique within the batch.
+
+    Terraform rejects two resources of the same type with the same name, so
+    repeats ("prod-vcn" and "prod.vcn" both become prod_vcn) get _1, _2, ...
+    """
+    used = set()
+    next_suffix = {}
+    result = []
+    for name in names:
+        base = sanitize_name(name)
+        suffix = next_suffix.get(base, 0)
+        candidate = f"{base}_{suffix}" if suffix else base
+        # A suffixed name can itself clash with a name taken literally
+        while candidate in used:
+            suffix += 1
+            candidate = f"{base}_{suffix}"
+        next_suffix[base] = suffix + 1
+        used.add(candidate)
+        result.append(candidate)
+    return result
+
+
+class ProviderSettings(NamedTuple):
+    """Region and tenancy written into provider.tf and the tfvars template."""
+    region: str
+    tenancy: str
+
+
+def get_provider_settings(config: dict) -> ProviderSettings:
+    """Read the provider settings out of the OCI config once."""
+    return ProviderSettings(
+        region=config.get("region", "us-ashburn-1"),
+        tenancy=config.get("tenancy", "")
+    )
+
+
+def generate_provider_block(settings: ProviderSettings) -> str:
     """Generate Terraform OCI provider block."""
     return f'''# Oracle Cloud Infrastructure Provider
 # Configure authentication via environment variables or OCI config file
@@ -92,14 +249,14 @@ provider "oci" {{
   # private_key_path = var.private_key_path
   # region           = var.region
 
-  region = "{config.get('region', 'us-ashburn-1')}"
+  region = "{settings.region}"
 }}
 
 # Variables for OCI authentication
 variable "tenancy_ocid" {{
   description = "OCID of the tenancy"
   type        = string
-  default     = "{config.get('tenancy', '')}"
+  default     = "{settings.tenancy}"
 }}
 
 variable "compartment_ocid" {{
@@ -110,29 +267,48 @@ variable "compartment_ocid" {{
 variable "region" {{
   description = "OCI region"
   type        = string
-  default     = "{config.get('region', 'us-ashburn-1')}"
+  default     = "{settings.region}"
 }}
 '''
 
 
-def export_vcn(network_client, compartment_id: str) -> list:
-    """Export VCN resources to Terraform."""
-    resources = []
+def list_in_vcn(list_method, compartment_id: str, vcn) -> list:
+    """List every resource of one kind in a VCN (subnets, gateways, ...)."""
+    return oci.pagination.list_call_get_all_results(
+        list_method,
+        compartment_id=compartment_id,
+        vcn_id=vcn.id
+    ).data
+
+
+def list_boot_volumes(compute_client, compartment_id: str, availability_domain: str) -> list:
+    """List the boot volume attachments of every instance in one availability domain."""
+    return oci.pagination.list_call_get_all_results(
+        compute_client.list_boot_volume_attachments,
+        availability_domain=availability_domain,
+        compartment_id=compartment_id
+    ).data
 
-    speak("Exporting VCNs...")
-    vcns = network_client.list_vcns(compartment_id=compartment_id).data
 
-    for vcn in vcns:
-        name = sanitize_name(vcn.display_name)
+def render_vcns(vcns: list, vcn_subnets: list, vcn_igws: list) -> Iterator[str]:
+    """Render VCNs with their subnets and internet gateways as HCL blocks."""
+    # Subnet and gateway names must be unique across all VCNs, not just within one
+    subnet_names = iter(unique_names(
+        subnet.display_name for subnets in vcn_subnets for subnet in subnets
+    ))
+    igw_names = iter(unique_names(igw.display_name for igws in vcn_igws for igw in igws))
+
+    for vcn, name, subnets, igws in zip(vcns, unique_names(vcn.display_name for vcn in vcns),
+                                        vcn_subnets, vcn_igws):
         resource = f'''
 # VCN: {vcn.display_name}
 resource "oci_core_vcn" "{name}" {{
   compartment_id = var.compartment_ocid
   display_name   = "{vcn.display_name}"
-  cidr_blocks    = {json.dumps(vcn.cidr_blocks)}
+  cidr_blocks    = {_encode_json(vcn.cidr_blocks)}
   dns_label      = "{vcn.dns_label or ''}"
 
-  freeform_tags = {json.dumps(vcn.freeform_tags or {{}})}
+  freeform_tags = {hcl_map(vcn.freeform_tags)}
 }}
 
 # Output VCN ID
@@ -140,16 +316,11 @@ output "{name}_vcn_id" {{
   value = oci_core_vcn.{name}.id
 }}
 '''
-        resources.append(resource)
+        yield resource
 
         # Export subnets for this VCN
-        subnets = network_client.list_subnets(
-            compartment_id=compartment_id,
-            vcn_id=vcn.id
-        ).data
-
         for subnet in subnets:
-            subnet_name = sanitize_name(subnet.display_name)
+            subnet_name = next(subnet_names)
             subnet_resource = f'''
 # Subnet: {subnet.display_name}
 resource "oci_core_subnet" "{subnet_name}" {{
@@ -160,19 +331,14 @@ resource "oci_core_subnet" "{subnet_name}" {{
   dns_label         = "{subnet.dns_label or ''}"
   prohibit_public_ip_on_vnic = {str(subnet.prohibit_public_ip_on_vnic).lower()}
 
-  freeform_tags = {json.dumps(subnet.freeform_tags or {{}})}
+  freeform_tags = {hcl_map(subnet.freeform_tags)}
 }}
 '''
-            resources.append(subnet_resource)
+            yield subnet_resource
 
         # Export internet gateway
-        igws = network_client.list_internet_gateways(
-            compartment_id=compartment_id,
-            vcn_id=vcn.id
-        ).data
-
         for igw in igws:
-            igw_name = sanitize_name(igw.display_name)
+            igw_name = next(igw_names)
             igw_resource = f'''
 # Internet Gateway: {igw.display_name}
 resource "oci_core_internet_gateway" "{igw_name}" {{
@@ -182,23 +348,34 @@ resource "oci_core_internet_gateway" "{igw_name}" {{
   enabled        = {str(igw.is_enabled).lower()}
 }}
 '''
-            resources.append(igw_resource)
+            yield igw_resource
 
-    speak(f"  Exported {len(vcns)} VCNs")
-    return resources
 
+def export_vcn(network_client, compartment_id: str) -> dict:
+    """Fetch VCNs with their subnets and gateways, as arguments for render_vcns."""
+    speak("Exporting VCNs...")
+    vcns = oci.pagination.list_call_get_all_results(
+        network_client.list_vcns,
+        compartment_id=compartment_id
+    ).data
 
-def export_compute(compute_client, compartment_id: str) -> list:
-    """Export compute instances to Terraform."""
-    resources = []
+    # Subnets and gateways for all VCNs are listed concurrently up front
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        vcn_subnets = list(executor.map(
+            partial(list_in_vcn, network_client.list_subnets, compartment_id), vcns
+        ))
+        vcn_igws = list(executor.map(
+            partial(list_in_vcn, network_client.list_internet_gateways, compartment_id), vcns
+        ))
 
-    speak("Exporting compute instances...")
-    instances = compute_client.list_instances(compartment_id=compartment_id).data
+    speak(f"  Exported {len(vcns)} VCNs")
+    return {"vcns": vcns, "vcn_subnets": vcn_subnets, "vcn_igws": vcn_igws}
 
-    active_instances = [i for i in instances if i.lifecycle_state not in ["TERMINATED", "TERMINATING"]]
 
-    for instance in active_instances:
-        name = sanitize_name(instance.display_name)
+def render_instances(instances: list, boot_vols_by_instance: dict) -> Iterator[str]:
+    """Render compute instances as HCL blocks."""
+    names = unique_names(instance.display_name for instance in instances)
+    for instance, name in zip(instances, names):
 
         # Get shape config for flex shapes
         shape_config = ""
@@ -209,16 +386,9 @@ def export_compute(compute_client, compartment_id: str) -> list:
     memory_in_gbs = {instance.shape_config.memory_in_gbs}
   }}'''
 
-        # Get boot volume details
-        boot_vols = compute_client.list_boot_volume_attachments(
-            availability_domain=instance.availability_domain,
-            compartment_id=compartment_id,
-            instance_id=instance.id
-        ).data
-
         source_details = ""
-        if boot_vols:
-            bv = boot_vols[0]
+        bv = boot_vols_by_instance.get(instance.id)
+        if bv:
             source_details = f'''
   source_details {{
     source_type = "bootVolume"
@@ -238,30 +408,45 @@ resource "oci_core_instance" "{name}" {{
   # Note: VNIC and metadata configuration may need manual adjustment
   # based on your specific requirements
 
-  freeform_tags = {json.dumps(instance.freeform_tags or {{}})}
+  freeform_tags = {hcl_map(instance.freeform_tags)}
 }}
 
 output "{name}_instance_id" {{
   value = oci_core_instance.{name}.id
 }}
 '''
-        resources.append(resource)
+        yield resource
 
-    speak(f"  Exported {len(active_instances)} compute instances")
-    return resources
 
+def export_compute(compute_client, compartment_id: str) -> dict:
+    """Fetch compute instances and boot volumes, as arguments for render_instances."""
+    speak("Exporting compute instances...")
+    instances = oci.pagination.list_call_get_all_results(
+        compute_client.list_instances,
+        compartment_id=compartment_id
+    ).data
 
-def export_block_storage(blockstorage_client, compartment_id: str) -> list:
-    """Export block volumes to Terraform."""
-    resources = []
+    active_instances = [i for i in instances if i.lifecycle_state not in ["TERMINATED", "TERMINATING"]]
 
-    speak("Exporting block volumes...")
-    volumes = blockstorage_client.list_volumes(compartment_id=compartment_id).data
+    # Boot volume details come from one listing per availability domain,
+    # fetched concurrently, rather than one call per instance
+    availability_domains = {i.availability_domain for i in active_instances}
+    boot_vols_by_instance = {}
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        for boot_vols in executor.map(
+            partial(list_boot_volumes, compute_client, compartment_id), availability_domains
+        ):
+            for bv in boot_vols:
+                # Keep the first attachment, as the per-instance listing did
+                boot_vols_by_instance.setdefault(bv.instance_id, bv)
 
-    active_volumes = [v for v in volumes if v.lifecycle_state == "AVAILABLE"]
+    speak(f"  Exported {len(active_instances)} compute instances")
+    return {"instances": active_instances, "boot_vols_by_instance": boot_vols_by_instance}
 
-    for volume in active_volumes:
-        name = sanitize_name(volume.display_name)
+
+def render_volumes(volumes: list) -> Iterator[str]:
+    """Render block volumes as HCL blocks."""
+    for volume, name in zip(volumes, unique_names(volume.display_name for volume in volumes)):
 
         resource = f'''
 # Block Volume: {volume.display_name}
@@ -272,31 +457,32 @@ resource "oci_core_volume" "{name}" {{
   size_in_gbs         = {volume.size_in_gbs}
   vpus_per_gb         = {volume.vpus_per_gb or 10}
 
-  freeform_tags = {json.dumps(volume.freeform_tags or {{}})}
+  freeform_tags = {hcl_map(volume.freeform_tags)}
 }}
 
 output "{name}_volume_id" {{
   value = oci_core_volume.{name}.id
 }}
 '''
-        resources.append(resource)
+        yield resource
 
-    speak(f"  Exported {len(active_volumes)} block volumes")
-    return resources
 
+def export_block_storage(blockstorage_client, compartment_id: str) -> dict:
+    """Fetch block volumes, as arguments for render_volumes."""
+    speak("Exporting block volumes...")
+    active_volumes = oci.pagination.list_call_get_all_results(
+        blockstorage_client.list_volumes,
+        compartment_id=compartment_id,
+        lifecycle_state="AVAILABLE"
+    ).data
 
-def export_object_storage(object_storage_client, namespace: str, compartment_id: str) -> list:
-    """Export object storage buckets to Terraform."""
-    resources = []
+    speak(f"  Exported {len(active_volumes)} block volumes")
+    return {"volumes": active_volumes}
 
-    speak("Exporting object storage buckets...")
-    buckets = object_storage_client.list_buckets(
-        namespace_name=namespace,
-        compartment_id=compartment_id
-    ).data
 
-    for bucket in buckets:
-        name = sanitize_name(bucket.name)
+def render_buckets(buckets: list, namespace: str) -> Iterator[str]:
+    """Render object storage buckets as HCL blocks."""
+    for bucket, name in zip(buckets, unique_names(bucket.name for bucket in buckets)):
 
         resource = f'''
 # Object Storage Bucket: {bucket.name}
@@ -309,32 +495,36 @@ resource "oci_objectstorage_bucket" "{name}" {{
   # Note: Additional settings like versioning, lifecycle rules
   # may need to be configured based on bucket details
 
-  freeform_tags = {json.dumps(bucket.freeform_tags or {{}})}
+  freeform_tags = {hcl_map(bucket.freeform_tags)}
 }}
 
 output "{name}_bucket_name" {{
   value = oci_objectstorage_bucket.{name}.name
 }}
 '''
-        resources.append(resource)
+        yield resource
 
-    speak(f"  Exported {len(buckets)} buckets")
-    return resources
 
+def export_object_storage(object_storage_client, compartment_id: str, tenancy_id: str,
+                          use_cache: bool = True) -> dict:
+    """Fetch object storage buckets, as arguments for render_buckets."""
+    speak("Exporting object storage buckets...")
+    namespace = get_namespace(object_storage_client, tenancy_id, use_cache=use_cache)
+    buckets = oci.pagination.list_call_get_all_results(
+        object_storage_client.list_buckets,
+        namespace_name=namespace,
+        compartment_id=compartment_id
+    ).data
 
-def export_load_balancers(lb_client, compartment_id: str) -> list:
-    """Export load balancers to Terraform."""
-    resources = []
-
-    speak("Exporting load balancers...")
-    lbs = lb_client.list_load_balancers(compartment_id=compartment_id).data
+    speak(f"  Exported {len(buckets)} buckets")
+    return {"buckets": buckets, "namespace": namespace}
 
-    active_lbs = [lb for lb in lbs if lb.lifecycle_state == "ACTIVE"]
 
-    for lb in active_lbs:
-        name = sanitize_name(lb.display_name)
+def render_load_balancers(lbs: list) -> Iterator[str]:
+    """Render load balancers as HCL blocks."""
+    for lb, name in zip(lbs, unique_names(lb.display_name for lb in lbs)):
 
-        subnet_ids = json.dumps(lb.subnet_ids) if lb.subnet_ids else '[]'
+        subnet_ids = _encode_json(lb.subnet_ids) if lb.subnet_ids else '[]'
 
         resource = f'''
 # Load Balancer: {lb.display_name}
@@ -347,17 +537,145 @@ resource "oci_load_balancer_load_balancer" "{name}" {{
 
   # Note: Backend sets, listeners, and certificates need manual configuration
 
-  freeform_tags = {json.dumps(lb.freeform_tags or {{}})}
+  freeform_tags = {hcl_map(lb.freeform_tags)}
 }}
 
 output "{name}_lb_ip" {{
   value = oci_load_balancer_load_balancer.{name}.ip_addresses
 }}
 '''
-        resources.append(resource)
+        yield resource
+
+
+def export_load_balancers(lb_client, compartment_id: str) -> dict:
+    """Fetch load balancers, as arguments for render_load_balancers."""
+    speak("Exporting load balancers...")
+    active_lbs = oci.pagination.list_call_get_all_results(
+        lb_client.list_load_balancers,
+        compartment_id=compartment_id,
+        lifecycle_state="ACTIVE"
+    ).data
 
     speak(f"  Exported {len(active_lbs)} load balancers")
-    return resources
+    return {"lbs": active_lbs}
+
+
+# Renderer for each resource type's fetched data
+RENDERERS = {
+    "network": render_vcns,
+    "compute": render_instances,
+    "storage": render_volumes,
+    "objectstorage": render_buckets,
+    "loadbalancer": render_load_balancers,
+}
+
+
+class SnapshotRecord(dict):
+    """
+    A snapshot JSON object that also reads like an SDK model.
+
+    Missing attributes are None, as on the models, and tag maps stay plain
+    dicts to the JSON encoder.
+    """
+
+    def __getattr__(self, name):
+        return self.get(name)
+
+
+def save_snapshot(snapshot_path: Path, fetched: dict):
+    """Write each resource type's fetched data to <type>.json."""
+    snapshot_path.mkdir(parents=True, exist_ok=True)
+    for resource_type, data in fetched.items():
+        snapshot_file = snapshot_path / f"{resource_type}.json"
+        snapshot_file.write_text(json.dumps(oci.util.to_dict(data), indent=2))
+        speak(f"Snapshot written: {snapshot_file}")
+
+
+def load_snapshot(snapshot_path: Path, resource_types) -> dict:
+    """Read fetched data saved by --snapshot, skipping types it doesn't have."""
+    fetched = {}
+    for resource_type in resource_types:
+        snapshot_file = snapshot_path / f"{resource_type}.json"
+        if not snapshot_file.exists():
+            speak(f"No {resource_type} snapshot in {snapshot_path}, skipping")
+            continue
+        try:
+            fetched[resource_type] = json.loads(snapshot_file.read_text(), object_hook=SnapshotRecord)
+        except ValueError as e:
+            print(f"Error: Invalid snapshot {snapshot_file}: {e}")
+            sys.exit(1)
+        speak(f"Loaded {resource_type} from snapshot")
+    return fetched
+
+
+def write_resources(tf_file: Path, resources: Iterator[str], generated_at: str):
+    """Write rendered HCL blocks to a .tf file under the generator header."""
+    with open(tf_file, "w", buffering=WRITE_BUFFER_BYTES) as f:
+        f.write(f"{GENERATED_HEADER}\n")
+        f.write(f"# Generated at: {generated_at}\n\n")
+        separator = ""
+        for resource in resources:
+            f.write(separator)
+            f.write(resource)
+            separator = "\n"
+
+
+def is_generated_file(path: Path) -> bool:
+    """Check whether a file was written by this generator."""
+    try:
+        with open(path) as f:
+            return f.read(len(GENERATED_HEADER)) == GENERATED_HEADER
+    except OSError:
+        return False
+
+
+def fetch_resources(args, oci_config: dict, compartment_id: str, resource_types) -> dict:
+    """Fetch the selected resource types from OCI, keyed by type."""
+    # Initialize clients, only for the resource types being exported
+    retry_strategy = get_retry_strategy()
+    clients = {
+        resource_type: client_class(oci_config, retry_strategy=retry_strategy)
+        for resource_type, client_class in RESOURCE_CLIENTS.items()
+        if resource_type in resource_types
+    }
+    if clients:
+        share_session(*clients.values())
+
+    # Export based on selected resource types
+    exporters = {}
+    if "network" in clients:
+        exporters["network"] = partial(export_vcn, clients["network"], compartment_id)
+
+    if "compute" in clients:
+        exporters["compute"] = partial(export_compute, clients["compute"], compartment_id)
+
+    if "storage" in clients:
+        exporters["storage"] = partial(export_block_storage, clients["storage"], compartment_id)
+
+    if "objectstorage" in clients:
+        exporters["objectstorage"] = partial(export_object_storage, clients["objectstorage"], compartment_id,
+                                             oci_config["tenancy"], use_cache=not args.no_cache)
+
+    if "loadbalancer" in clients:
+        exporters["loadbalancer"] = partial(export_load_balancers, clients["loadbalancer"], compartment_id)
+
+    fetched = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+            futures = {
+                resource_type: executor.submit(exporter)
+                for resource_type, exporter in exporters.items()
+            }
+            # Collected in submission order so files are announced the same way every run
+            for resource_type, future in futures.items():
+                fetched[resource_type] = future.result()
+
+    except oci.exceptions.ServiceError as e:
+        print(f"Error: {e.message}")
+        sys.exit(1)
+
+    return fetched
 
 
 def run_export(args):
@@ -376,69 +694,51 @@ def run_export(args):
     output_path = Path(args.output).expanduser()
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Initialize clients
-    compute_client = oci.core.ComputeClient(oci_config)
-    network_client = oci.core.VirtualNetworkClient(oci_config)
-    blockstorage_client = oci.core.BlockstorageClient(oci_config)
-    object_storage_client = oci.object_storage.ObjectStorageClient(oci_config)
-    lb_client = oci.load_balancer.LoadBalancerClient(oci_config)
-
-    # Get object storage namespace
-    namespace = object_storage_client.get_namespace().data
-
     # Determine which resources to export
-    resource_types = args.resources.split(",") if args.resources else [
-        "network", "compute", "storage", "objectstorage", "loadbalancer"
-    ]
-
-    all_resources = []
-
-    try:
-        # Export based on selected resource types
-        if "network" in resource_types or args.all:
-            all_resources.extend(export_vcn(network_client, compartment_id))
-
-        if "compute" in resource_types or args.all:
-            all_resources.extend(export_compute(compute_client, compartment_id))
-
-        if "storage" in resource_types or args.all:
-            all_resources.extend(export_block_storage(blockstorage_client, compartment_id))
-
-        if "objectstorage" in resource_types or args.all:
-            all_resources.extend(export_object_storage(object_storage_client, namespace, compartment_id))
-
-        if "loadbalancer" in resource_types or args.all:
-            all_resources.extend(export_load_balancers(lb_client, compartment_id))
-
-    except oci.exceptions.ServiceError as e:
-        print(f"Error: {e.message}")
-        sys.exit(1)
+    if args.all or not args.resources:
+        resource_types = RESOURCE_CLIENTS.keys()
+    else:
+        resource_types = args.resources.split(",")
+
+    if args.from_snapshot:
+        # No clients and no API calls: re-render what an earlier run saved
+        fetched = load_snapshot(Path(args.from_snapshot).expanduser(),
+                                [t for t in RESOURCE_CLIENTS if t in resource_types])
+    else:
+        fetched = fetch_resources(args, oci_config, compartment_id, resource_types)
+        if args.snapshot:
+            save_snapshot(Path(args.snapshot).expanduser(), fetched)
 
     # Write provider file
-    provider_content = generate_provider_block(oci_config)
+    settings = get_provider_settings(oci_config)
+    provider_content = generate_provider_block(settings)
     provider_file = output_path / "provider.tf"
     with open(provider_file, "w") as f:
         f.write(provider_content)
     speak(f"Written: {provider_file}")
 
-    # Write main resources file
-    main_content = "# Oracle Cloud Infrastructure Resources\n"
-    main_content += "# Generated by generate_terraform.py\n"
-    main_content += f"# Generated at: {datetime.now().isoformat()}\n\n"
-    main_content += "\n".join(all_resources)
+    # Write one resources file per resource type (network.tf, compute.tf, ...).
+    # HCL blocks are rendered as each file is written rather than held in memory
+    generated_at = datetime.now().isoformat()
+    for resource_type, data in fetched.items():
+        tf_file = output_path / f"{resource_type}.tf"
+        write_resources(tf_file, RENDERERS[resource_type](**data), generated_at)
+        speak(f"Written: {tf_file}")
 
+    # Exports used to put everything in main.tf; left in place it would
+    # declare every resource a second time
     main_file = output_path / "main.tf"
-    with open(main_file, "w") as f:
-        f.write(main_content)
-    speak(f"Written: {main_file}")
+    if is_generated_file(main_file):
+        main_file.unlink()
+        speak(f"Removed: {main_file} (resources are now split by type)")
 
     # Write terraform.tfvars template
     tfvars_content = f'''# Terraform Variables
 # Edit these values for your environment
 
-tenancy_ocid    = "{oci_config.get('tenancy', '')}"
+tenancy_ocid    = "{settings.tenancy}"
 compartment_ocid = "{compartment_id}"
-region          = "{oci_config.get('region', 'us-ashburn-1')}"
+region          = "{settings.region}"
 '''
 
     tfvars_file = output_path / "terraform.tfvars.example"
@@ -470,6 +770,8 @@ Examples:
     generate_terraform.py --compartment ocid1... --output ./terraform
     generate_terraform.py --resources compute,network --output ./terraform
     generate_terraform.py --all --output ./terraform
+    generate_terraform.py --snapshot ./snap         # Save fetched data too
+    generate_terraform.py --from-snapshot ./snap    # Re-render offline
 
 Resource Types:
     network      - VCNs, subnets, internet gateways
@@ -507,6 +809,21 @@ Screen Reader Notes:
         action="store_true",
         help="Export all resource types"
     )
+    parser.add_argument(
+        "--snapshot",
+        metavar="DIR",
+        help="Also save the fetched OCI data to DIR for --from-snapshot"
+    )
+    parser.add_argument(
+        "--from-snapshot",
+        metavar="DIR",
+        help="Render from data saved with --snapshot instead of calling OCI"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the cached Object Storage namespace"
+    )
 
     args = parser.parse_args()
 
@@ -5,6 +5,7 @@ After Dark Systems - Ops Utils
 """
 
 import json
+import os
 import subprocess
 import sys
 from typing import Any, Optional
@@ -19,24 +20,37 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+def _log_prefix(color: str, label: str, stream: Any) -> str:
+    """Build a log prefix once, without color for NO_COLOR or non-TTY output."""
+    if os.environ.get("NO_COLOR") is None and stream.isatty():
+        return f"{color}[{label}]{Colors.NC}"
+    return f"[{label}]"
+
+
+_INFO_PREFIX = _log_prefix(Colors.BLUE, "INFO", sys.stdout)
+_SUCCESS_PREFIX = _log_prefix(Colors.GREEN, "SUCCESS", sys.stdout)
+_WARN_PREFIX = _log_prefix(Colors.YELLOW, "WARN", sys.stdout)
+_ERROR_PREFIX = _log_prefix(Colors.RED, "ERROR", sys.stderr)
+
+
 def log_info(message: str) -> None:
     """Print info message in blue."""
-    print(f"{Colors.BLUE}[INFO]{Colors.NC} {message}")
+    print(_INFO_PREFIX, message)
 
 
 def log_success(message: str) -> None:
     """Print success message in green."""
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.NC} {message}")
+    print(_SUCCESS_PREFIX, message)
 
 
 def log_warn(message: str) -> None:
     """Print warning message in yellow."""
-    print(f"{Colors.YELLOW}[WARN]{Colors.NC} {message}")
+    print(_WARN_PREFIX, message)
 
 
 def log_error(message: str) -> None:
     """Print error message in red to stderr."""
-    print(f"{Colors.RED}[ERROR]{Colors.NC} {message}", file=sys.stderr)
+    print(_ERROR_PREFIX, message, file=sys.stderr)
 
 
 def run_oci_command(